@@ -0,0 +1 @@
+"""Benchmarks for Unidecode. Run with python -m benchmarks."""
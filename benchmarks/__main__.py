@@ -0,0 +1,268 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+"""Run Unidecode benchmarks.
+
+    $ python -m benchmarks -o before.json
+    $ git checkout my-branch
+    $ python -m benchmarks -o after.json
+    $ python -m benchmarks --compare before.json after.json
+
+Run this from the root of the source tree so that the local copy of
+Unidecode is benchmarked. Results are the best time per call in seconds.
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import timeit
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.corpora import get_corpora
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+ERRORS = ('ignore', 'replace', 'preserve', 'strict')
+
+def best_time(func, min_time, repeat):
+    """Return the best time of a single call of func in seconds."""
+    timer = timeit.Timer(func)
+
+    number = max(1, int(min_time / max(timer.timeit(1), 1e-9)))
+
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+def run_python(code):
+    """Run code in a fresh interpreter and return the float it prints."""
+    out = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT)
+    return float(out)
+
+def import_benchmark():
+    return run_python(
+            'import time\n'
+            't = time.perf_counter()\n'
+            'import unidecode\n'
+            'print(time.perf_counter() - t)\n')
+
+def cold_benchmark(corpus_name):
+    # Tables are loaded during the first call in a fresh interpreter.
+    return run_python(
+            'import time\n'
+            'from benchmarks.corpora import get_corpora\n'
+            'text = dict(get_corpora())[%r]\n'
+            'import unidecode\n'
+            't = time.perf_counter()\n'
+            'unidecode.unidecode(text)\n'
+            'print(time.perf_counter() - t)\n' % (corpus_name,))
+
+def warm_benchmarks(corpora):
+    """Yield (name, func) for benchmarks that run with loaded tables."""
+    import unidecode
+    import unidecode.codec
+
+    for name, text in corpora:
+        words = text.split(' ')
+        data = text.encode('utf-8')
+
+        def stream(data=data):
+            unidecode.unidecode_stream(io.BytesIO(data), io.StringIO())
+
+        yield 'unidecode/' + name, lambda text=text: unidecode.unidecode(text)
+        if not text.isascii() and text.encode('latin-1', 'ignore') == text.encode('latin-1', 'replace'):
+            # Same text through the generic path, for comparison with the
+            # Latin-1 fast path.
+            generic = text + '\u0100'
+            yield 'unidecode_generic/' + name, lambda generic=generic: unidecode.unidecode(generic)
+
+        yield 'unidecode_expect_ascii/' + name, lambda text=text: unidecode.unidecode_expect_ascii(text)
+        yield 'unidecode_expect_nonascii/' + name, lambda text=text: unidecode.unidecode_expect_nonascii(text)
+        yield 'map_unidecode/' + name, lambda words=words: list(map(unidecode.unidecode, words))
+        yield 'unidecode_many/' + name, lambda words=words: unidecode.unidecode_many(words)
+        yield 'unidecode_bytes/' + name, lambda text=text: unidecode.unidecode_bytes(text)
+        yield 'unidecode_utf8/' + name, lambda data=data: unidecode.unidecode_utf8(data)
+        yield 'decode_unidecode_encode/' + name, \
+                lambda data=data: unidecode.unidecode(data.decode('utf-8')).encode('ascii')
+        yield 'unidecode_with_offsets/' + name, lambda text=text: unidecode.unidecode_with_offsets(text)
+        yield 'unidecode_stream/' + name, stream
+        yield 'codec/' + name, lambda text=text: text.encode('unidecode', errors='ignore')
+
+        for errors in ERRORS:
+            try:
+                unidecode.unidecode(text, errors=errors)
+            except unidecode.UnidecodeError:
+                # Corpus has characters without replacements.
+                continue
+
+            yield 'errors_%s/%s' % (errors, name), \
+                    lambda text=text, errors=errors: unidecode.unidecode(text, errors=errors)
+
+        yield 'errors_callable/' + name, \
+                lambda text=text: unidecode.unidecode(text, errors=lambda char, index: '?')
+
+def string_cache_benchmarks(corpora):
+    """Yield (name, func) for map_unidecode with set_string_cache()
+    enabled, where words repeat as in the other benchmarks."""
+    import unidecode
+
+    unidecode.set_string_cache(100000)
+    try:
+        for name, text in corpora:
+            words = text.split(' ')
+            yield 'string_cache/' + name, lambda words=words: list(map(unidecode.unidecode, words))
+    finally:
+        unidecode.set_string_cache(None)
+
+def token_cache_benchmarks(corpora):
+    """Yield (name, func) for unidecode with set_token_cache() enabled."""
+    import unidecode
+
+    unidecode.set_token_cache(100000)
+    try:
+        for name, text in corpora:
+            yield 'token_cache/' + name, lambda text=text: unidecode.unidecode(text)
+    finally:
+        unidecode.set_token_cache(None)
+
+def numpy_benchmarks(corpora):
+    """Yield (name, func) for unidecode.numpy and np.vectorize(unidecode)
+    on arrays of words. Nothing is yielded if NumPy isn't installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        return
+
+    import unidecode
+    from unidecode.numpy import unidecode_array
+
+    vectorized = np.vectorize(unidecode.unidecode)
+
+    for name, text in corpora:
+        words = np.array(text.split(' '))
+        yield 'numpy_array/' + name, lambda words=words: unidecode_array(words)
+        yield 'numpy_vectorize/' + name, lambda words=words: vectorized(words)
+
+def thread_counts(max_threads):
+    n = 1
+    while n < max_threads:
+        yield n
+        n *= 2
+    yield max_threads
+
+def thread_benchmarks(corpora, max_threads):
+    """Yield (name, func) for benchmarks where each of n threads
+    transliterates the same words at the same time.
+
+    Every thread does the same amount of work, so with perfect scaling the
+    time stays the same as n grows.
+    """
+    import unidecode
+
+    words = dict(corpora)['mixed'].split(' ')
+
+    def work(i):
+        unidecode.unidecode_many(words)
+
+    for n in thread_counts(max_threads):
+        with ThreadPoolExecutor(max_workers=n) as executor:
+            yield 'threads_%d/mixed' % (n,), lambda executor=executor, n=n: list(executor.map(work, range(n)))
+
+def run(args):
+    corpora = get_corpora()
+    pattern = re.compile(args.filter) if args.filter else None
+
+    results = {}
+
+    def record(name, func):
+        if pattern is not None and not pattern.search(name):
+            return
+
+        results[name] = func()
+        sys.stderr.write('%-45s %12.3f us\n' % (name, results[name] * 1e6))
+
+    record('import', lambda: min(import_benchmark() for i in range(args.repeat)))
+
+    for name, text in corpora:
+        record('cold/' + name, lambda name=name: min(cold_benchmark(name) for i in range(args.repeat)))
+
+    for name, func in warm_benchmarks(corpora):
+        # Warm up the tables before timing.
+        func()
+        record(name, lambda func=func: best_time(func, args.min_time, args.repeat))
+
+    for name, func in string_cache_benchmarks(corpora):
+        func()
+        record(name, lambda func=func: best_time(func, args.min_time, args.repeat))
+
+    for name, func in token_cache_benchmarks(corpora):
+        func()
+        record(name, lambda func=func: best_time(func, args.min_time, args.repeat))
+
+    for name, func in numpy_benchmarks(corpora):
+        func()
+        record(name, lambda func=func: best_time(func, args.min_time, args.repeat))
+
+    for name, func in thread_benchmarks(corpora, args.threads):
+        func()
+        record(name, lambda func=func: best_time(func, args.min_time, args.repeat))
+
+    output = {
+        'metadata': {
+            'python': sys.version,
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            # False on free-threaded builds of CPython with the GIL disabled
+            'gil_enabled': getattr(sys, '_is_gil_enabled', lambda: True)(),
+        },
+        'results': results,
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(output, f, indent=4, sort_keys=True)
+    else:
+        json.dump(output, sys.stdout, indent=4, sort_keys=True)
+        sys.stdout.write('\n')
+
+def compare(before_path, after_path):
+    with open(before_path) as f:
+        before = json.load(f)['results']
+    with open(after_path) as f:
+        after = json.load(f)['results']
+
+    print('%-45s %12s %12s %8s' % ('benchmark', 'before (us)', 'after (us)', 'change'))
+
+    for name in sorted(set(before) | set(after)):
+        if name in before and name in after:
+            print('%-45s %12.3f %12.3f %7.2fx' % (name, before[name] * 1e6, after[name] * 1e6,
+                before[name] / after[name]))
+        elif name in before:
+            print('%-45s %12.3f %12s %8s' % (name, before[name] * 1e6, '-', ''))
+        else:
+            print('%-45s %12s %12.3f %8s' % (name, '-', after[name] * 1e6, ''))
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Unidecode benchmarks and output results as JSON.")
+    parser.add_argument('-o', '--output', metavar='FILE',
+            help='Write results to FILE instead of standard output')
+    parser.add_argument('-k', '--filter', metavar='REGEX',
+            help='Only run benchmarks with names matching REGEX')
+    parser.add_argument('--min-time', type=float, default=0.1,
+            help='Minimum time in seconds for each timing run (default is 0.1)')
+    parser.add_argument('--repeat', type=int, default=3,
+            help='Number of timing runs for each benchmark (default is 3)')
+    parser.add_argument('--threads', type=int, default=os.cpu_count() or 1,
+            help='Maximum number of threads for the threads_N benchmarks (default is the number of CPUs)')
+    parser.add_argument('--compare', nargs=2, metavar=('BEFORE', 'AFTER'),
+            help='Compare two result files instead of running benchmarks')
+
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+    else:
+        run(args)
+
+main()
@@ -0,0 +1,104 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+"""Benchmark corpora, one for each group of scripts.
+
+Text is generated from a fixed random seed, so that corpora are the same on
+every run and results can be compared between commits.
+"""
+import random
+
+# Approximate length of each corpus in characters
+CORPUS_LENGTH = 10000
+
+ASCII_WORDS = ('the', 'of', 'and', 'to', 'in', 'is', 'that', 'for', 'it',
+        'with', 'as', 'was', 'on', 'be', 'by', 'this', 'from', 'at', 'or',
+        'which', 'price', 'order', 'shipping', 'street', 'city', 'name')
+
+def _chars(*ranges):
+    chars = []
+    for start, end in ranges:
+        chars.extend(chr(c) for c in range(start, end + 1))
+    return chars
+
+def _words(rnd, chars, count, min_len=2, max_len=8):
+    return [''.join(rnd.choice(chars) for _ in range(rnd.randint(min_len, max_len)))
+            for _ in range(count)]
+
+def _text(rnd, vocabulary, sep=' '):
+    words = []
+    length = 0
+    while length < CORPUS_LENGTH:
+        word = rnd.choice(vocabulary)
+        words.append(word)
+        length += len(word) + len(sep)
+    return sep.join(words)
+
+def _latin1(rnd):
+    # Mostly ASCII words with occasional accented ones, like Western
+    # European text.
+    accented = _words(rnd, _chars((0x61, 0x7a), (0xe0, 0xff)), 50)
+    return _text(rnd, list(ASCII_WORDS) * 4 + accented)
+
+def _latin1_sparse(rnd):
+    # English text with an accented name every 50 to 900 characters.
+    names = ('Ren\u00e9e', 'Zo\u00eb', 'M\u00fcller', 'N\u00fa\u00f1ez', 'Fran\u00e7ois', 'Jos\u00e9')
+    words = []
+    length = 0
+    gap = 0
+    while length < CORPUS_LENGTH:
+        if gap <= 0:
+            word = rnd.choice(names)
+            gap = rnd.randint(50, 900)
+        else:
+            word = rnd.choice(ASCII_WORDS)
+            gap -= len(word) + 1
+        words.append(word)
+        length += len(word) + 1
+    return ' '.join(words)
+
+def _latin_extended(rnd):
+    return _text(rnd, _words(rnd, _chars((0x61, 0x7a), (0x100, 0x17f), (0x180, 0x24f)), 500))
+
+def _cyrillic(rnd):
+    return _text(rnd, _words(rnd, _chars((0x410, 0x44f)), 500))
+
+def _greek(rnd):
+    return _text(rnd, _words(rnd, _chars((0x391, 0x3a9), (0x3b1, 0x3c9)), 500))
+
+def _cjk(rnd):
+    return _text(rnd, _words(rnd, _chars((0x4e00, 0x9fa5)), 2000, 1, 4), '')
+
+def _hangul(rnd):
+    return _text(rnd, _words(rnd, _chars((0xac00, 0xd7a3)), 2000, 1, 4))
+
+def _math(rnd):
+    return _text(rnd, _words(rnd, _chars((0x1d400, 0x1d6a3), (0x1d7ce, 0x1d7ff)), 500))
+
+def _emoji(rnd):
+    # Chat messages: ASCII words with emoji, most of which have no
+    # replacement.
+    emoji = _chars((0x1f300, 0x1f64f))
+    return _text(rnd, list(ASCII_WORDS) + emoji)
+
+def _mixed(rnd):
+    vocabulary = []
+    for make in (_latin1, _latin_extended, _cyrillic, _greek, _cjk, _hangul, _math, _emoji):
+        vocabulary.extend(make(rnd).split(' ')[:200])
+    return _text(rnd, vocabulary)
+
+_generators = (
+    ('ascii', lambda rnd: _text(rnd, ASCII_WORDS)),
+    ('latin1', _latin1),
+    ('latin1_sparse', _latin1_sparse),
+    ('latin_extended', _latin_extended),
+    ('cyrillic', _cyrillic),
+    ('greek', _greek),
+    ('cjk', _cjk),
+    ('hangul', _hangul),
+    ('math', _math),
+    ('emoji', _emoji),
+    ('mixed', _mixed),
+)
+
+def get_corpora():
+    """Return a list of (name, text) tuples."""
+    return [(name, make(random.Random(name))) for name, make in _generators]
@@ -2,13 +2,28 @@
 # vi:tabstop=4:expandtab:sw=4
 
 import os
+import sys
 from setuptools import setup
+from setuptools.command.build_py import build_py
 
 
 def get_long_description():
     with open(os.path.join(os.path.dirname(__file__), "README.rst"), encoding='utf-8') as fp:
         return fp.read()
 
+class build_py_tables(build_py):
+    """Also pack the xNNN table modules into a single data file."""
+
+    def run(self):
+        super().run()
+
+        sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+        from unidecode.packed import TABLES_FILE, write_tables
+
+        path = os.path.join(self.build_lib, 'unidecode', TABLES_FILE)
+        if not self.dry_run:
+            write_tables(path)
+
 setup(
     name='Unidecode',
     version='1.4.0',
@@ -20,7 +35,11 @@ setup(
 
     packages=['unidecode'],
     package_data={'unidecode': ['py.typed']},
+    cmdclass={'build_py': build_py_tables},
     python_requires=">=3.7",
+    extras_require={
+        'numpy': ['numpy'],
+    },
 
     test_suite='tests',
 
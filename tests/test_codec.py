@@ -0,0 +1,61 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+import codecs
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+import unidecode.codec
+
+
+class TestCodec(unittest.TestCase):
+
+    def test_encode(self):
+        self.assertEqual(b'Knosos', 'Κνωσός'.encode('unidecode'))
+        self.assertEqual(b'Bei Jing ', '北亰'.encode('unidecode'))
+        self.assertEqual(b'Hello', 'Hello'.encode('unidecode'))
+
+    def test_decode(self):
+        self.assertEqual('Hello', b'Hello'.decode('unidecode'))
+
+    def test_lookup(self):
+        self.assertEqual('unidecode', codecs.lookup('Unidecode').name)
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_errors_strict(self):
+        with self.assertRaises(UnicodeEncodeError) as e:
+            'test \U000f0000 test'.encode('unidecode')
+
+        self.assertEqual(5, e.exception.start)
+        self.assertEqual(6, e.exception.end)
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_errors_handlers(self):
+        s = 'č \U000f0000 č \U000f0001'
+
+        self.assertEqual(b'c  c ', s.encode('unidecode', errors='ignore'))
+        self.assertEqual(b'c ? c ?', s.encode('unidecode', errors='replace'))
+        self.assertEqual(b'c \\U000f0000 c \\U000f0001',
+                s.encode('unidecode', errors='backslashreplace'))
+
+    def test_incremental_encoder(self):
+        encoder = codecs.getincrementalencoder('unidecode')()
+        out = b''.join(encoder.encode(c) for c in 'český ') + encoder.encode('', final=True)
+        self.assertEqual(b'cesky ', out)
+
+    def test_stream_writer(self):
+        f = io.BytesIO()
+        writer = codecs.getwriter('unidecode')(f)
+        writer.write('北亰')
+        self.assertEqual(b'Bei Jing ', f.getvalue())
+
+    def test_open(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'out.txt')
+            with open(path, 'w', encoding='unidecode') as f:
+                f.write('Příliš ')
+                f.write('žluťoučký\n')
+
+            with open(path, 'rb') as f:
+                self.assertEqual(b'Prilis zlutoucky\n', f.read())
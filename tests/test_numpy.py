@@ -0,0 +1,70 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+import unittest
+
+from unidecode import UnidecodeError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore
+else:
+    from unidecode.numpy import unidecode_array
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestUnidecodeArray(unittest.TestCase):
+
+    def test_unicode(self):
+        a = np.array(['Hello', 'Zoë', '北亰', ''])
+        o = unidecode_array(a)
+
+        self.assertEqual('U', o.dtype.kind)
+        self.assertEqual(['Hello', 'Zoe', 'Bei Jing ', ''], o.tolist())
+
+        # The original is not modified.
+        self.assertEqual('Zoë', a[1])
+
+    def test_unicode_shape(self):
+        a = np.array([['Zoë', 'a'], ['b', 'Český']])
+        o = unidecode_array(a)
+
+        self.assertEqual((2, 2), o.shape)
+        self.assertEqual([['Zoe', 'a'], ['b', 'Cesky']], o.tolist())
+
+    def test_unicode_byteorder(self):
+        a = np.array(['Zoë', 'abc'], dtype='>U3')
+        self.assertEqual(['Zoe', 'abc'], unidecode_array(a).tolist())
+
+    def test_unicode_ascii(self):
+        a = np.array(['abc', 'de'])
+        o = unidecode_array(a)
+
+        self.assertEqual(a.dtype, o.dtype)
+        self.assertEqual(['abc', 'de'], o.tolist())
+
+    def test_zero_dimensions(self):
+        o = unidecode_array(np.array('Zo\u00eb'))
+
+        self.assertEqual((), o.shape)
+        self.assertEqual('Zoe', o[()])
+
+    def test_object(self):
+        a = np.array(['Zoë', None, 'abc', '北'], dtype=object)
+        o = unidecode_array(a)
+
+        self.assertEqual(object, o.dtype)
+        self.assertEqual(['Zoe', None, 'abc', 'Bei '], o.tolist())
+
+    def test_errors(self):
+        a = np.array(['a\ue000', 'b'])
+
+        self.assertEqual(['a?', 'b'], unidecode_array(a, errors='replace').tolist())
+
+        with self.assertRaises(UnidecodeError) as e:
+            unidecode_array(a, errors='strict')
+
+        self.assertEqual(1, e.exception.index)
+
+    def test_invalid_dtype(self):
+        with self.assertRaises(TypeError):
+            unidecode_array(np.array([1, 2]))
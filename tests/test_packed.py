@@ -0,0 +1,154 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+import multiprocessing
+import os
+import tempfile
+import unittest
+
+import unidecode
+from unidecode.packed import open_tables, write_tables
+
+from tests.test_unidecode import BaseTestUnidecode
+
+
+def build_tables(tmpdir):
+    path = os.path.join(tmpdir, 'tables.bin')
+    write_tables(path)
+    return open_tables(path)
+
+def use_tables(tables):
+    # Make the following lookups use tables (or modules if None) from a
+    # clean state.
+    unidecode._packed_tables = tables
+    unidecode._packed_tables_opened = True
+    unidecode.Cache.clear()
+    unidecode._translation_tables.clear()
+
+class TestPackedTables(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_same_as_modules(self):
+        tables = build_tables(self.tmpdir.name)
+
+        for section in range(0x1000):
+            try:
+                mod = __import__('unidecode.x%03x' % (section,), globals(), locals(), ['data'])
+            except ImportError:
+                self.assertIsNone(tables.section(section))
+                continue
+
+            packed = tables.section(section)
+            self.assertEqual(len(mod.data), len(packed))
+            self.assertEqual(list(mod.data), list(packed))
+
+    def test_strings_shared(self):
+        tables = build_tables(self.tmpdir.name)
+
+        # 'Yi ' appears in many CJK sections, but is decoded only once.
+        a = tables.section(0x4e)[0x00]
+        b = tables.section(0x5f)[0x02]
+        self.assertEqual('Yi ', a)
+        self.assertIs(a, b)
+
+        stats = tables.stats()
+        self.assertLess(stats['distinct_strings'], stats['entries'])
+        self.assertLess(stats['blob_bytes'], stats['string_bytes'])
+        self.assertEqual(1, stats['decoded_strings'])
+
+    def test_invalid_file(self):
+        path = os.path.join(self.tmpdir.name, 'invalid.bin')
+        with open(path, 'wb') as f:
+            f.write(b'not a tables file')
+
+        self.assertIsNone(open_tables(path))
+
+    def test_missing_file(self):
+        path = os.path.join(self.tmpdir.name, 'missing.bin')
+        self.assertIsNone(open_tables(path))
+
+def transliterate(s):
+    return unidecode.unidecode(s), unidecode._packed_tables is not None
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None  # type: ignore
+
+@unittest.skipIf(shared_memory is None, "multiprocessing.shared_memory is not available")
+class TestSharedTables(unittest.TestCase):
+
+    def setUp(self):
+        self.name = unidecode.share_tables()
+
+    def tearDown(self):
+        use_tables(None)
+        unidecode._packed_tables_opened = False
+        unidecode.unshare_tables()
+
+    def test_share_once(self):
+        self.assertEqual(self.name, unidecode.share_tables())
+
+    def test_attach(self):
+        unidecode.attach_tables(self.name)
+
+        self.assertIsNotNone(unidecode._packed_tables)
+        self.assertEqual('Bei Jing ', unidecode.unidecode('\u5317\u4EB0'))
+        self.assertEqual([0x4e, 0x53], unidecode.loaded_sections())
+
+    def test_pool(self):
+        with multiprocessing.Pool(2, initializer=unidecode.attach_tables, initargs=(self.name,)) as pool:
+            results = pool.map(transliterate, ['\u010cesk\u00fd', '\u5317\u4EB0'])
+
+        self.assertEqual([('Cesky', True), ('Bei Jing ', True)], results)
+
+    def test_unshare(self):
+        unidecode.unshare_tables()
+
+        with self.assertRaises(FileNotFoundError):
+            unidecode.attach_tables(self.name)
+
+class TestMemoryReport(unittest.TestCase):
+
+    def test_packed(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            use_tables(build_tables(tmpdir))
+            try:
+                unidecode.unidecode('\u5317\u4EB0')
+                report = unidecode.memory_report()
+            finally:
+                use_tables(None)
+                unidecode._packed_tables_opened = False
+
+        self.assertEqual(2, report['sections_loaded'])
+        self.assertEqual(2, report['decoded_strings'])
+        self.assertIn('file_bytes', report)
+
+    def test_modules(self):
+        use_tables(None)
+        try:
+            unidecode.unidecode('\u5317\u4EB0')
+            report = unidecode.memory_report()
+        finally:
+            unidecode._packed_tables_opened = False
+
+        self.assertEqual(2, report['sections_loaded'])
+        self.assertGreater(report['table_bytes'], 0)
+        self.assertGreater(report['distinct_strings'], 0)
+
+class TestUnidecodePacked(BaseTestUnidecode, unittest.TestCase):
+    unidecode = staticmethod(unidecode.unidecode)
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        use_tables(build_tables(cls.tmpdir.name))
+
+    @classmethod
+    def tearDownClass(cls):
+        use_tables(None)
+        unidecode._packed_tables_opened = False
+        cls.tmpdir.cleanup()
@@ -1,8 +1,17 @@
 # -*- coding: utf-8 -*-
 # vim:ts=4 sw=4 expandtab softtabstop=4
+import gc
+import io
 import unittest
 import sys
+import threading
+import time
+import unidecode as unidecode_module
 from unidecode import unidecode, unidecode_expect_ascii, unidecode_expect_nonascii, UnidecodeError
+from unidecode import preload, loaded_sections, unidecode_many, unidecode_stream
+from unidecode import unidecode_bytes, unidecode_into, unidecode_utf8, unidecode_with_offsets
+from unidecode import Instrumentation, set_instrumentation
+from unidecode import set_cache_policy, set_string_cache, set_token_cache, cache_stats
 import warnings
 
 
@@ -150,6 +159,25 @@ class BaseTestUnidecode():
 
             self.assertEqual(b, a)
 
+    def test_hangul(self):
+        self.assertEqual('ga', self.unidecode('\uac00'))
+        self.assertEqual('hih', self.unidecode('\ud7a3'))
+        self.assertEqual('hangugeo', self.unidecode('\ud55c\uad6d\uc5b4'))
+        self.assertEqual('seoul', self.unidecode('\uc11c\uc6b8'))
+        self.assertEqual('jjwaelb', self.unidecode('\ucaff'))
+
+        # Not assigned after the last syllable
+        self.assertEqual('', self.unidecode('\ud7a4'))
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_mathematical_greek(self):
+        self.assertEqual('Alpha', self.unidecode('\U0001d6a8'))
+        self.assertEqual('omega', self.unidecode('\U0001d6da'))
+        self.assertEqual('ij', self.unidecode('\U0001d6a4\U0001d6a5'))
+
+        # Only bold Greek letters have replacements
+        self.assertEqual('', self.unidecode('\U0001d6e2'))
+
     def test_specific(self):
 
         TESTS = [
@@ -523,6 +551,35 @@ class BaseTestUnidecode():
         # "During handling of the above exception, another exception occurred")
         self.assertIsNone(e.exception.__context__)
 
+    def test_errors_invalid_all_mapped(self):
+        # An invalid errors value is detected even if every character has a
+        # replacement.
+        with self.assertRaises(UnidecodeError):
+            self.unidecode("\u010desk\u00fd", errors='invalid')
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_errors_callable(self):
+        calls = []
+
+        def handler(char, index):
+            calls.append((char, index))
+            return '<%x>' % (ord(char),)
+
+        o = self.unidecode("\u010d \U000f0000 \u010d \U000f0000\U000f0001", errors=handler)
+
+        self.assertEqual('c <f0000> c <f0000><f0001>', o)
+        self.assertEqual([('\U000f0000', 2), ('\U000f0000', 6), ('\U000f0001', 7)], calls)
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_errors_modes_independent(self):
+        # Results for one errors mode must not leak into another.
+        s = "\u010d \U000f0000"
+        self.assertEqual('c ?', self.unidecode(s, errors='replace'))
+        self.assertEqual('c [?]', self.unidecode(s, errors='replace', replace_str='[?]'))
+        self.assertEqual('c ', self.unidecode(s, errors='ignore'))
+        self.assertEqual('c \U000f0000', self.unidecode(s, errors='preserve'))
+        self.assertEqual('c ?', self.unidecode(s, errors='replace'))
+
     def test_degree(self):
         self.assertEqual(self.unidecode('\u2109'), self.unidecode('\u00b0F'))
         self.assertEqual(self.unidecode('\u2103'), self.unidecode('\u00b0C'))
@@ -536,5 +593,522 @@ class TestUnidecodeExpectASCII(BaseTestUnidecode, unittest.TestCase):
 class TestUnidecodeExpectNonASCII(BaseTestUnidecode, unittest.TestCase):
     unidecode = staticmethod(unidecode_expect_nonascii)
 
+class TestUnidecodeMany(BaseTestUnidecode, unittest.TestCase):
+    @staticmethod
+    def unidecode(string, *args, **kwargs):
+        return unidecode_many([string], *args, **kwargs)[0]
+
+    def test_many(self):
+        strings = iter(['Hello', '\u010cesk\u00fd', '', '\u5317\u4EB0'])
+        self.assertEqual(['Hello', 'Cesky', '', 'Bei Jing '], unidecode_many(strings))
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_many_strict(self):
+        with self.assertRaises(UnidecodeError) as e:
+            unidecode_many(['abc', 'a \U000f0000'], errors='strict')
+
+        self.assertEqual(2, e.exception.index)
+
+class TestUnidecodeBytes(BaseTestUnidecode, unittest.TestCase):
+    @staticmethod
+    def unidecode(string, *args, **kwargs):
+        o = unidecode_bytes(string, *args, **kwargs)
+        assert isinstance(o, bytes)
+        return o.decode('utf-8')
+
+    def test_into(self):
+        buffer = bytearray(b'a=')
+        self.assertEqual(5, unidecode_into('\u010cesk\u00fd', buffer))
+        self.assertEqual(0, unidecode_into('', buffer))
+        self.assertEqual(1, unidecode_into(';', buffer))
+        self.assertEqual(bytearray(b'a=Cesky;'), buffer)
+
+    def test_into_offset(self):
+        buffer = bytearray(b'a=......;')
+        self.assertEqual(5, unidecode_into('\u010cesk\u00fd', memoryview(buffer), offset=2))
+        self.assertEqual(bytearray(b'a=Cesky.;'), buffer)
+
+        # Nothing is written if the result doesn't fit.
+        with self.assertRaises(ValueError):
+            unidecode_into('\u5317', buffer, offset=6)
+        with self.assertRaises(ValueError):
+            unidecode_into('a', buffer, offset=-1)
+
+        self.assertEqual(bytearray(b'a=Cesky.;'), buffer)
+
+class TestUnidecodeUTF8(BaseTestUnidecode, unittest.TestCase):
+    @staticmethod
+    def unidecode(string, *args, **kwargs):
+        return unidecode_utf8(string.encode('utf-8'), *args, **kwargs).decode('utf-8')
+
+    @unittest.skip("surrogates can't be encoded in UTF-8")
+    def test_surrogates(self):
+        pass
+
+    @unittest.skip("surrogates can't be encoded in UTF-8")
+    def test_surrogate_pairs(self):
+        pass
+
+    @unittest.skip("indexes are offsets in bytes, see test_strict_index")
+    def test_errors_callable(self):
+        pass
+
+    def test_buffers(self):
+        data = '\u010cesk\u00fd'.encode('utf-8')
+        self.assertEqual(b'Cesky', unidecode_utf8(memoryview(data)))
+        self.assertEqual(b'Cesky', unidecode_utf8(bytearray(data)))
+        self.assertEqual(b'Hello', unidecode_utf8(b'Hello'))
+
+        o = unidecode_utf8(memoryview(b'Hello'))
+        self.assertEqual(b'Hello', o)
+        self.assertIs(bytes, type(o))
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_strict_index(self):
+        # Index is an offset in bytes.
+        with self.assertRaises(UnidecodeError) as e:
+            unidecode_utf8('\u010d\u010d \U000f0000'.encode('utf-8'), errors='strict')
+
+        self.assertEqual(5, e.exception.index)
+        self.assertIsNone(e.exception.__context__)
+
+    def test_invalid(self):
+        data = b'a\xff\xc3\xa9\xe2\x82 b'
+
+        self.assertEqual(b'ae b', unidecode_utf8(data))
+        self.assertEqual(b'a?e? b', unidecode_utf8(data, errors='replace'))
+        self.assertEqual(data.replace(b'\xc3\xa9', b'e'), unidecode_utf8(data, errors='preserve'))
+
+        with self.assertRaises(UnidecodeError) as e:
+            unidecode_utf8(data, errors='strict')
+
+        self.assertEqual(1, e.exception.index)
+        self.assertIsNone(e.exception.__context__)
+
+    def test_invalid_callable(self):
+        calls = []
+
+        def handler(char, index):
+            calls.append((char, index))
+            return '?'
+
+        self.assertEqual(b'a?e?', unidecode_utf8(b'a\xff\xc3\xa9\xe2\x82', errors=handler))
+        self.assertEqual([('\udcff', 1), ('\udce2\udc82', 4)], calls)
+
+    def test_invalid_many(self):
+        # Time taken is linear in the number of invalid sequences. Decoding
+        # the rest of the run again after each of them made it quadratic.
+        data = b'\xff\xc3\xa9\xe2\x82' * 50000
+
+        self.assertEqual(b'?e?' * 50000, unidecode_utf8(data, errors='replace'))
+        self.assertEqual(data.replace(b'\xc3\xa9', b'e'), unidecode_utf8(data, errors='preserve'))
+
+class TestUnidecodeWithOffsets(BaseTestUnidecode, unittest.TestCase):
+    @staticmethod
+    def unidecode(string, *args, **kwargs):
+        o, offsets = unidecode_with_offsets(string, *args, **kwargs)
+        assert len(o) == len(offsets)
+        return o
+
+    def test_offsets(self):
+        o, offsets = unidecode_with_offsets('Zo\u00eb \u5317\u4EB0!')
+
+        self.assertEqual('Zoe Bei Jing !', o)
+        self.assertEqual([0, 1, 2, 3, 4, 4, 4, 4, 5, 5, 5, 5, 5, 6], list(offsets))
+
+        # Span of "Jing" in the original
+        start = o.index('Jing')
+        self.assertEqual('\u4EB0', 'Zo\u00eb \u5317\u4EB0!'[offsets[start]:offsets[start + 3] + 1])
+
+    def test_offsets_ignored(self):
+        o, offsets = unidecode_with_offsets('a\ue000b')
+
+        self.assertEqual('ab', o)
+        self.assertEqual([0, 2], list(offsets))
+
+    def test_offsets_long(self):
+        # Offsets for long strings are correct, but not kept afterwards.
+        n = unidecode_module._max_identity + 10
+        for s in ('a' * n, '\u00e9' * n):
+            o, offsets = unidecode_with_offsets(s)
+            self.assertEqual(list(range(n)), list(offsets))
+
+        self.assertLessEqual(len(unidecode_module._identity), unidecode_module._max_identity)
+
+class TestUnidecodeStream(BaseTestUnidecode, unittest.TestCase):
+    @staticmethod
+    def unidecode(string, *args, **kwargs):
+        reader = io.BytesIO(string.encode('utf-8'))
+        writer = io.StringIO()
+        unidecode_stream(reader, writer, 'utf-8', *args, **kwargs)
+        return writer.getvalue()
+
+    @unittest.skip("surrogates can't be encoded in UTF-8")
+    def test_surrogates(self):
+        pass
+
+    @unittest.skip("surrogates can't be encoded in UTF-8")
+    def test_surrogate_pairs(self):
+        pass
+
+    def test_chunk_boundaries(self):
+        s = '\u010d\u0161\u5317\u4EB0 \U0001d5c4\U0001d5c6\n' * 10
+        for chunk_size in range(1, 8):
+            writer = io.StringIO()
+            unidecode_stream(io.BytesIO(s.encode('utf-8')), writer, chunk_size=chunk_size)
+            self.assertEqual('csBei Jing  km\n' * 10, writer.getvalue())
+
+    @unittest.skipIf(sys.maxunicode < 0x10000, "narrow build")
+    def test_strict_index(self):
+        s = 'abc\u010d' * 10 + '\U000f0000'
+        with self.assertRaises(UnidecodeError) as e:
+            unidecode_stream(io.BytesIO(s.encode('utf-8')), io.StringIO(), errors='strict', chunk_size=7)
+
+        self.assertEqual(40, e.exception.index)
+
+    def test_decode_error(self):
+        with self.assertRaises(UnicodeDecodeError):
+            unidecode_stream(io.BytesIO(b'abc\xff'), io.StringIO())
+
+    def test_decode_error_output(self):
+        # Text before the error is written, even in the same chunk.
+        data = '\u010desky\n'.encode('utf-8') * 10 + b'bad \xff'
+
+        for chunk_size in (1, 7, 0x10000):
+            writer = io.StringIO()
+            with self.assertRaises(UnicodeDecodeError):
+                unidecode_stream(io.BytesIO(data), writer, chunk_size=chunk_size)
+
+            self.assertEqual('cesky\n' * 10 + 'bad ', writer.getvalue())
+
+class TestUnidecodeStringCache(BaseTestUnidecode, unittest.TestCase):
+    unidecode = staticmethod(unidecode)
+
+    def setUp(self):
+        set_string_cache(1000)
+
+    def tearDown(self):
+        set_string_cache(None)
+
+    def test_stats(self):
+        for i in range(3):
+            self.assertEqual('Cesky', unidecode('\u010cesk\u00fd'))
+            self.assertEqual(['Cesky', 'Zoe'], unidecode_many(['\u010cesk\u00fd', 'Zo\u00eb']))
+
+        stats = cache_stats()
+        self.assertEqual(7, stats['string_hits'])
+        self.assertEqual(2, stats['string_misses'])
+        self.assertEqual(2, stats['strings'])
+
+    def test_errors_in_key(self):
+        s = 'a\ue000'
+        self.assertEqual('a', unidecode(s))
+        self.assertEqual('a?', unidecode(s, errors='replace'))
+        self.assertEqual('a[?]', unidecode(s, errors='replace', replace_str='[?]'))
+        self.assertEqual(s, unidecode(s, errors='preserve'))
+
+    def test_instrumentation(self):
+        # Results are not served from the cache, so each unmapped character
+        # is reported.
+        instrumentation = Instrumentation()
+        set_instrumentation(instrumentation)
+        self.addCleanup(set_instrumentation, None)
+
+        for i in range(3):
+            self.assertEqual('a?', unidecode('a\U0001F600', errors='replace'))
+        self.assertEqual(['a?'], unidecode_many(['a\U0001F600'], errors='replace'))
+
+        self.assertEqual({'replace': 4}, instrumentation.unmapped)
+
+    def test_max_strings(self):
+        set_string_cache(2)
+        for s in ('\u010c', '\u010d', '\u010e'):
+            unidecode(s)
+
+        self.assertEqual(2, cache_stats()['strings'])
+
+        with self.assertRaises(ValueError):
+            set_string_cache(0)
+        with self.assertRaises(ValueError):
+            set_string_cache(2, max_length=0)
+
+    def test_max_length(self):
+        set_string_cache(1000, max_length=5)
+        self.assertEqual('Cesky', unidecode('\u010cesk\u00fd'))
+        self.assertEqual(['Cesky republika'], unidecode_many(['\u010cesk\u00fd republika']))
+
+        self.assertEqual(1, cache_stats()['strings'])
+
+    def test_surrogates_not_cached(self):
+        # Each occurrence produces a warning.
+        for i in range(3):
+            with warnings.catch_warnings(record=True) as w:
+                warnings.simplefilter('always')
+                self.assertEqual('a', unidecode('a\ud800'))
+
+            self.assertEqual(1, len(w))
+
+        self.assertEqual(0, cache_stats()['strings'])
+
+class TestUnidecodeTokenCache(BaseTestUnidecode, unittest.TestCase):
+    unidecode = staticmethod(unidecode_expect_nonascii)
+
+    def setUp(self):
+        set_token_cache(1000)
+
+    def tearDown(self):
+        set_token_cache(None)
+
+    def test_stats(self):
+        s = '\u041f\u0440\u0438\u0432\u0435\u0442, \u043c\u0438\u0440! ' * 3
+        self.assertEqual('Privet, mir! ' * 3, unidecode(s))
+
+        stats = cache_stats()
+        self.assertEqual(4, stats['token_hits'])
+        self.assertEqual(2, stats['token_misses'])
+        self.assertEqual(2, stats['tokens'])
+
+    def test_max_length(self):
+        set_token_cache(1000, max_length=5)
+
+        s = '\u041f\u0440\u0438\u0432\u0435\u0442, \u043c\u0438\u0440! ' * 2
+        self.assertEqual('Privet, mir! ' * 2, unidecode(s))
+
+        # Only the shorter run is cached.
+        stats = cache_stats()
+        self.assertEqual(1, stats['token_hits'])
+        self.assertEqual(1, stats['token_misses'])
+        self.assertEqual(1, stats['tokens'])
+
+    def test_max_tokens(self):
+        with self.assertRaises(ValueError):
+            set_token_cache(0)
+        with self.assertRaises(ValueError):
+            set_token_cache(1000, max_length=0)
+
+class TestPreload(unittest.TestCase):
+
+    def setUp(self):
+        unidecode_module.Cache.clear()
+
+    def test_preload_sections(self):
+        preload([0x04, 0x4e, 0xa5], freeze=False)
+
+        # Section 0xa5 has no table
+        self.assertEqual([0x04, 0x4e], loaded_sections())
+        self.assertEqual('Privet', unidecode('\u041f\u0440\u0438\u0432\u0435\u0442'))
+
+    def test_preload_all(self):
+        try:
+            preload()
+            self.assertGreater(gc.get_freeze_count(), 0)
+        finally:
+            gc.unfreeze()
+
+        sections = loaded_sections()
+        self.assertIn(0x00, sections)
+        self.assertIn(0x1f6, sections)
+        self.assertNotIn(0xa5, sections)
+
+class TestLatin1(unittest.TestCase):
+
+    def test_table(self):
+        # The fast path gives the same results as section 0x00.
+        s = ''.join(chr(c) for c in range(0x100))
+        expected = ''.join(unidecode_module._get_repl_str(c) for c in s)
+
+        for errors in ('ignore', 'strict', 'replace', 'preserve'):
+            self.assertEqual(expected, unidecode(s, errors=errors))
+
+    def test_sparse(self):
+        # Mostly ASCII text is split into runs instead.
+        s = 'x' * 1000 + 'Ren\u00e9e \u00bd'
+        for errors in ('ignore', 'strict', 'replace', 'preserve'):
+            self.assertEqual('x' * 1000 + 'Renee  1/2', unidecode(s, errors=errors))
+
+    def test_invalid_errors(self):
+        with self.assertRaises(UnidecodeError):
+            unidecode('Zo\u00eb', errors='invalid')
+
+class TestCachePolicy(unittest.TestCase):
+
+    def setUp(self):
+        unidecode_module.Cache.clear()
+        unidecode_module._translation_tables.clear()
+
+    def tearDown(self):
+        set_cache_policy(None)
+
+    def test_max_sections(self):
+        set_cache_policy(max_sections=2)
+        before = cache_stats()
+
+        self.assertEqual('PBei Zoe', unidecode('\u041f\u5317Zo\u00eb'))
+        self.assertEqual([0x00, 0x53], loaded_sections())
+
+        # Section 0x04 was evicted and is loaded again.
+        self.assertEqual('P', unidecode('\u041f'))
+        self.assertEqual([0x00, 0x04], loaded_sections())
+
+        stats = cache_stats()
+        self.assertEqual(2, stats['sections'])
+        self.assertEqual(4, stats['misses'] - before['misses'])
+        self.assertEqual(2, stats['evictions'] - before['evictions'])
+
+    def test_lru(self):
+        set_cache_policy(max_sections=2)
+
+        unidecode('\u043f\u0440\u0438\u0432\u0435\u0442')
+        unidecode('\u5317')
+        # Use 0x04 again, so 0x53 is the least recently used.
+        for i in range(5):
+            unidecode('\u043f\u0440\u0438\u0432\u0435\u0442')
+        unidecode('\u30a2')
+
+        self.assertEqual([0x04, 0x30], loaded_sections())
+
+    def test_lru_functions(self):
+        set_cache_policy(max_sections=2)
+
+        uses = [
+            lambda: unidecode_many(['\u041f']),
+            lambda: unidecode_utf8('\u041f'.encode('utf-8')),
+            lambda: unidecode_with_offsets('\u041f'),
+            lambda: unidecode('\u041f', errors=lambda char, index: '?'),
+        ]
+
+        for use in uses:
+            unidecode('\u041f')
+            unidecode('\u5317')
+            use()
+            unidecode('\u30a2')
+
+            self.assertEqual([0x04, 0x30], loaded_sections())
+
+    def test_set_policy_evicts(self):
+        unidecode('\u041f\u5317\u00eb')
+        set_cache_policy(max_sections=1)
+
+        self.assertEqual(1, len(loaded_sections()))
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            set_cache_policy(max_sections=0)
+
+class TestThreads(unittest.TestCase):
+
+    def setUp(self):
+        unidecode_module.Cache.clear()
+        unidecode_module._translation_tables.clear()
+
+        self.load_section = unidecode_module._load_section
+        self.loads = []
+
+        def slow_load_section(section):
+            # Give other threads time to miss the same section.
+            self.loads.append(section)
+            time.sleep(0.01)
+            return self.load_section(section)
+
+        unidecode_module._load_section = slow_load_section
+
+    def tearDown(self):
+        unidecode_module._load_section = self.load_section
+
+    def test_load_once(self):
+        barrier = threading.Barrier(8)
+        results = []
+
+        def run():
+            barrier.wait()
+            results.append(unidecode('\u5317\u4EB0'))
+
+        threads = [threading.Thread(target=run) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(['Bei Jing '] * 8, results)
+        self.assertEqual([0x4e, 0x53], sorted(self.loads))
+
+    def test_load_once_bounded(self):
+        # Moving a section to the end of a bounded cache doesn't remove it,
+        # so threads that look it up at the same time don't load it again.
+        set_cache_policy(max_sections=4)
+        self.addCleanup(set_cache_policy, None)
+
+        unidecode('\u4e00\u5300')
+        barrier = threading.Barrier(8)
+
+        def run(i):
+            barrier.wait()
+            for codepoint in range(i, 0x100, 8):
+                unidecode(chr(0x4e00 + codepoint) + chr(0x5300 + codepoint))
+
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([0x4e, 0x53], sorted(self.loads))
+
+class TestInstrumentation(unittest.TestCase):
+
+    def setUp(self):
+        unidecode_module.Cache.clear()
+
+    def tearDown(self):
+        set_instrumentation(None)
+
+    def test_counters(self):
+        instrumentation = Instrumentation()
+        set_instrumentation(instrumentation)
+
+        # Sections 0x04 and 0x53 have tables, 0xa5 doesn't.
+        unidecode('\u041f\u5317\ua500\ua500')
+        unidecode('\ua500', errors='replace')
+
+        self.assertEqual(2, instrumentation.section_loads)
+        self.assertGreater(instrumentation.section_load_time, 0)
+        self.assertEqual(3, instrumentation.section_misses)
+        self.assertEqual({'ignore': 2, 'replace': 1}, instrumentation.unmapped)
+        self.assertEqual(0, instrumentation.surrogates)
+
+    def test_surrogates(self):
+        instrumentation = Instrumentation()
+        set_instrumentation(instrumentation)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            unidecode('\ud835\udce3')
+
+        self.assertEqual(2, instrumentation.surrogates)
+
+    def test_callbacks(self):
+        loads = []
+
+        class Collector(Instrumentation):
+            def on_section_load(self, section, seconds):
+                super().on_section_load(section, seconds)
+                loads.append(section)
+
+        set_instrumentation(Collector())
+        unidecode('\u041f\u5317')
+
+        self.assertEqual([0x04, 0x53], loads)
+
+    def test_errors_function(self):
+        instrumentation = Instrumentation()
+        set_instrumentation(instrumentation)
+
+        handler = lambda char, index: '?'
+        self.assertEqual('a?', unidecode('a\U0001F600', errors=handler))
+        self.assertEqual(b'a?', unidecode_utf8('a\U0001F600'.encode('utf-8'), errors=handler))
+        self.assertEqual('a?', unidecode_with_offsets('a\U0001F600', errors=handler)[0])
+
+        self.assertEqual({'callable': 3}, instrumentation.unmapped)
+
 if __name__ == "__main__":
     unittest.main()
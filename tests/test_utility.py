@@ -1,4 +1,5 @@
 # vim:ts=4 sw=4 expandtab softtabstop=4
+import io
 import os
 import locale
 import unittest
@@ -7,6 +8,7 @@ import sys
 import tempfile
 import re
 
+from unidecode.util import LineCounter, transliterate_parallel
 
 here = os.path.dirname(__file__)
 
@@ -63,7 +65,83 @@ class TestUnidecodeUtility(unittest.TestCase):
         out, err = p.communicate(self.TEST_UNICODE.encode(locale.getpreferredencoding()))
         self.assertEqual(out.decode('ascii'), self.TEST_ASCII)
 
+    def test_decode_error_line(self):
+        f = temp(b'abc\n' * 3 + b'xy\xffz\n')
+        out, err, rc = run(['-e', 'utf8', f.name])
+
+        self.assertEqual(out, 'abc\n' * 3 + 'xy')
+        self.assertEqual(err, 'Unable to decode input line 3: invalid start byte, start: 2, end: 3\n')
+        self.assertEqual(rc, 1)
+
+    def test_long_line(self):
+        f = temp(self.TEST_UNICODE.encode('utf8') * 100000)
+        out, err, rc = run(['-e', 'utf8', f.name])
+
+        self.assertEqual(out, self.TEST_ASCII * 100000)
+        self.assertEqual(rc, 0)
+
+    def test_jobs(self):
+        f = temp((self.TEST_UNICODE + '\n').encode('utf8') * 1000)
+        out, err, rc = run(['-e', 'utf8', '-j', '2', f.name])
+
+        self.assertEqual(out, (self.TEST_ASCII + '\n') * 1000)
+        self.assertEqual(rc, 0)
+
+    def test_jobs_utf16(self):
+        f = temp((self.TEST_UNICODE + '\n').encode('utf-16') * 1000)
+        out, err, rc = run(['-e', 'utf-16', '-j', '2', f.name])
+
+        self.assertEqual(out, (self.TEST_ASCII + '\n') * 1000)
+        self.assertEqual(rc, 0)
+
+    def test_jobs_decode_error_line(self):
+        f = temp(b'abc\n' * 3 + b'xy\xffz\n')
+        out, err, rc = run(['-e', 'utf8', '-j', '2', f.name])
+
+        self.assertEqual(out, 'abc\n' * 3 + 'xy')
+        self.assertEqual(err, 'Unable to decode input line 3: invalid start byte, start: 2, end: 3\n')
+        self.assertEqual(rc, 1)
+
+    def test_stats(self):
+        f = temp(self.TEST_UNICODE.encode('utf8'))
+        out, err, rc = run(['-e', 'utf8', '--stats', f.name])
+
+        self.assertEqual(out, self.TEST_ASCII)
+        self.assertRegex(err, '^Transliterated 3 bytes in ')
+        self.assertEqual(rc, 0)
+
     def test_commandline(self):
         out, err, rc = run(['-e', 'sjis', '-c', self.TEST_UNICODE.encode('sjis')])
         self.assertEqual(out, self.TEST_ASCII + '\n')
         self.assertEqual(rc, 0)
+
+class TestTransliterateParallel(unittest.TestCase):
+
+    def transliterate(self, data, encoding, block_size):
+        writer = io.StringIO()
+        transliterate_parallel(LineCounter(io.BytesIO(data)), writer, encoding, 2, block_size)
+        return writer.getvalue()
+
+    def test_blocks(self):
+        # Many blocks, split in the middle of lines and of multibyte
+        # characters, are written in order.
+        text = ''.join('%d \u5317\u4eac abc\n' % (i,) for i in range(200))
+        expected = ''.join('%d Bei Jing  abc\n' % (i,) for i in range(200))
+
+        for encoding in ('utf-8', 'utf-16', 'sjis'):
+            for block_size in (1, 7, 100):
+                out = self.transliterate(text.encode(encoding), encoding, block_size)
+                self.assertEqual(expected, out)
+
+    def test_decode_error_line(self):
+        reader = LineCounter(io.BytesIO(b'abc\n' * 3 + b'xy\xffz\n'))
+
+        writer = io.StringIO()
+
+        with self.assertRaises(UnicodeDecodeError) as e:
+            transliterate_parallel(reader, writer, 'utf-8', 2, 5)
+
+        self.assertEqual((3, 2, 3), reader.decode_error_position(e.exception))
+        # Blocks before the error and the text before it in the same block
+        # are written.
+        self.assertEqual('abc\n' * 3 + 'xy', writer.getvalue())
@@ -13,13 +13,122 @@ for the same character based on language, position, or anything else.
 
 A standard string object will be returned. If you need bytes, use:
 
->>> unidecode("Κνωσός").encode("ascii")
+>>> unidecode_bytes("Κνωσός")
 b'Knosos'
 """
+import codecs
+import functools
+import gc
+import operator
+import re
+import struct
+import sys
+import threading
+import time
 import warnings
-from typing import Dict, Optional, Sequence
+from array import array
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, Dict, Iterable, List, Match, Optional, Sequence, TextIO, Tuple, Union
 
-Cache: Dict[int, Optional[Sequence[Optional[str]]]] = {}
+from unidecode import hangul, mathematical
+from unidecode.packed import PackedTables, create_shared_block, module_sections, open_tables, pack_tables
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+# Function that returns the replacement for a character without one in the
+# tables, given the character and its index.
+ErrorHandler = Callable[[str, int], str]
+Errors = Union[str, ErrorHandler]
+
+# Any writable bytes-like object, like bytearray, memoryview or mmap. This is
+# Buffer in typeshed, which is not available in the typing module on older
+# versions of Python.
+WritableBuffer = Any
+
+Cache: 'OrderedDict[int, Optional[Sequence[Optional[str]]]]' = OrderedDict()
+
+# Maximum number of sections in Cache, or None if unbounded. When bounded,
+# Cache is kept in least recently used order: each call moves the sections
+# of its characters to the end with _touch_sections().
+_max_sections: Optional[int] = None
+_cache_stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+
+# Cache is read without locking. Loading is done at most once per section:
+# threads that miss the same section wait on its lock in _section_locks and
+# then find it in Cache. _cache_lock serializes inserting, reordering and
+# evicting sections, which all change the order of Cache. This keeps
+# lookups correct without the GIL, as in free-threaded builds of CPython.
+# Counters in _cache_stats may miss updates from concurrent threads.
+_section_locks: Dict[int, threading.Lock] = {}
+_cache_lock = threading.Lock()
+
+# Least recently used cache of results by input string, errors and
+# replace_str, set by set_string_cache(). None if disabled. Only strings of
+# up to _max_string_length characters are cached.
+_string_cache: Optional[Callable[[str, str, str], str]] = None
+_max_string_length = 256
+
+# Maximum number of non-ASCII runs remembered by each translation table, set
+# by set_token_cache(). None if disabled. Only runs of up to
+# _max_token_length characters are remembered.
+_max_tokens: Optional[int] = None
+_max_token_length = 32
+
+# Packed tables, opened when the first section is loaded. None if the
+# packed file isn't available and sections are imported from xNNN modules.
+_packed_tables: Optional[PackedTables] = None
+_packed_tables_opened = False
+_packed_tables_lock = threading.Lock()
+
+# Shared memory block created by share_tables(), if any
+_shared_memory: Optional['SharedMemory'] = None
+
+class Instrumentation:
+    """Counters for table loads and lookups.
+
+    Pass an instance to set_instrumentation() to start collecting. Override
+    the on_* methods (and call the base method to keep the counters) to
+    forward events to a metrics system.
+
+    Attributes:
+
+    section_loads -- number of sections loaded
+    section_load_time -- total time spent loading sections in seconds
+    section_misses -- number of lookups in sections that have no table
+    unmapped -- dict with the number of characters without a replacement,
+                for each errors mode ('callable' for errors functions)
+    surrogates -- number of surrogate characters warned about
+    """
+
+    def __init__(self) -> None:
+        self.section_loads = 0
+        self.section_load_time = 0.
+        self.section_misses = 0
+        self.unmapped: Dict[str, int] = {}
+        self.surrogates = 0
+
+    def on_section_load(self, section: int, seconds: float) -> None:
+        """Called after the table for section was loaded in seconds."""
+        self.section_loads += 1
+        self.section_load_time += seconds
+
+    def on_section_miss(self, section: int) -> None:
+        """Called when a character is looked up in a section without a table."""
+        self.section_misses += 1
+
+    def on_unmapped(self, char: str, errors: str) -> None:
+        """Called when a character without a replacement is handled
+        according to errors, which is 'callable' for errors functions."""
+        self.unmapped[errors] = self.unmapped.get(errors, 0) + 1
+
+    def on_surrogate(self, char: str) -> None:
+        """Called when a warning is issued for a surrogate character."""
+        self.surrogates += 1
+
+# Disabled unless set with set_instrumentation(). Only checked on the slow
+# paths, when a character is seen for the first time or has no replacement.
+_instrumentation: Optional[Instrumentation] = None
 
 class UnidecodeError(ValueError):
     def __init__(self, message: str, index: Optional[int] = None) -> None:
@@ -32,7 +141,7 @@ class UnidecodeError(ValueError):
         self.index = index
 
 
-def unidecode_expect_ascii(string: str, errors: str = 'ignore', replace_str: str = '?') -> str:
+def unidecode_expect_ascii(string: str, errors: Errors = 'ignore', replace_str: str = '?') -> str:
     """Transliterate an Unicode object into an ASCII string
 
     >>> unidecode("\u5317\u4EB0")
@@ -42,9 +151,10 @@ def unidecode_expect_ascii(string: str, errors: str = 'ignore', replace_str: str
     If it fails (because of non-ASCII characters), it falls back to
     transliteration using the character tables.
 
-    This is approx. five times faster if the string only contains ASCII
-    characters, but slightly slower than unicode_expect_nonascii if
-    non-ASCII characters are present.
+    Runs of ASCII characters in a string that is not entirely ASCII are
+    copied unchanged and only the remaining characters are looked up in
+    the tables. This is much faster for mostly ASCII text, but slower than
+    unicode_expect_nonascii if most characters are non-ASCII.
 
     errors specifies what to do with characters that have not been
     found in replacement tables. The default is 'ignore' which ignores
@@ -52,20 +162,22 @@ def unidecode_expect_ascii(string: str, errors: str = 'ignore', replace_str: str
     substitutes the character with replace_str (default is '?').
     'preserve' keeps the original character.
 
+    errors can also be a function. It is called with the character and its
+    index in the string and returns the string to use in its place.
+
+    An invalid value for errors raises UnidecodeError, before any character
+    is transliterated.
+
     Note that if 'preserve' is used the returned string might not be
     ASCII!
     """
 
-    try:
-        bytestring = string.encode('ASCII')
-    except UnicodeEncodeError:
-        pass
-    else:
+    if string.isascii():
         return string
 
-    return _unidecode(string, errors, replace_str)
+    return _unidecode(string, errors, replace_str, split_ascii=True)
 
-def unidecode_expect_nonascii(string: str, errors: str = 'ignore', replace_str: str = '?') -> str:
+def unidecode_expect_nonascii(string: str, errors: Errors = 'ignore', replace_str: str = '?') -> str:
     """Transliterate an Unicode object into an ASCII string
 
     >>> unidecode("\u5317\u4EB0")
@@ -78,6 +190,489 @@ def unidecode_expect_nonascii(string: str, errors: str = 'ignore', replace_str:
 
 unidecode = unidecode_expect_ascii
 
+def unidecode_many(strings: Iterable[str], errors: Errors = 'ignore', replace_str: str = '?') -> List[str]:
+    """Transliterate each string in an iterable and return a list of results
+
+    >>> unidecode_many(["Zo\u00eb", "Ren\u00e9e"])
+    ['Zoe', 'Renee']
+
+    This gives the same results as calling unidecode() on each string, but
+    is faster for many short strings since the errors mode is resolved only
+    once. See unidecode_expect_ascii for the meaning of errors and
+    replace_str.
+    """
+    if callable(errors):
+        handler = errors
+        return [_unidecode_handler(string, handler) for string in strings]
+
+    table = _get_translation_table(errors, replace_str)
+
+    string_cache = _string_cache
+    if string_cache is not None and _instrumentation is None:
+        return [string if string.isascii()
+                else string_cache(string, errors, replace_str) if _cacheable(string)
+                else _unidecode_uncached(string, errors, replace_str)
+                for string in strings]
+
+    retval: List[str] = []
+    append = retval.append
+
+    try:
+        for string in strings:
+            if string.isascii():
+                append(string)
+            else:
+                _touch_sections(string)
+                append(string.translate(table))
+    except _UnmappedCharacter as e:
+        char = e.char
+    else:
+        return retval
+
+    raise _unmapped_error(string, char)
+
+def unidecode_bytes(string: str, errors: Errors = 'ignore', replace_str: str = '?') -> bytes:
+    """Transliterate an Unicode object into ASCII bytes
+
+    >>> unidecode_bytes("\u5317\u4EB0")
+    b'Bei Jing '
+
+    See unidecode_expect_ascii for the meaning of errors and replace_str. If
+    errors is 'preserve', characters without a replacement are encoded in
+    UTF-8.
+    """
+    if string.isascii():
+        return string.encode('ascii')
+
+    # The result is almost always ASCII. CPython encodes ASCII strings to
+    # UTF-8 with a single copy, without checking each character.
+    return _unidecode(string, errors, replace_str, split_ascii=True).encode('utf-8')
+
+def unidecode_into(string: str, buffer: WritableBuffer, errors: Errors = 'ignore',
+        replace_str: str = '?', offset: Optional[int] = None) -> int:
+    """Transliterate an Unicode object and write the ASCII bytes to buffer
+
+    >>> buffer = bytearray(b'name=')
+    >>> unidecode_into("Zo\u00eb", buffer)
+    3
+    >>> buffer
+    bytearray(b'name=Zoe')
+
+    If offset is None, buffer must be a bytearray and the bytes are appended
+    to it. Otherwise buffer can be any writable bytes-like object, such as a
+    memoryview of a preallocated message, and the bytes are written to it
+    starting at offset. ValueError is raised without writing anything if
+    they don't fit.
+
+    Returns the number of bytes written. The result is encoded once, as by
+    unidecode_bytes, and copied into buffer. See unidecode_bytes for the
+    meaning of errors and replace_str.
+    """
+    data = unidecode_bytes(string, errors, replace_str)
+
+    if offset is None:
+        buffer += data
+    else:
+        view = memoryview(buffer).cast('B')
+        end = offset + len(data)
+        if offset < 0 or end > len(view):
+            raise ValueError('%d bytes at offset %d don\'t fit in a buffer of %d bytes'
+                    % (len(data), offset, len(view)))
+        view[offset:end] = data
+
+    return len(data)
+
+def unidecode_utf8(data: Union[bytes, bytearray, memoryview], errors: Errors = 'ignore',
+        replace_str: str = '?') -> bytes:
+    """Transliterate UTF-8 encoded bytes into ASCII bytes
+
+    >>> unidecode_utf8("\u5317\u4EB0".encode("utf-8"))
+    b'Bei Jing '
+
+    Runs of ASCII bytes are copied unchanged. Only runs of non-ASCII bytes
+    are decoded and transliterated, so the whole input is never decoded
+    into a str.
+
+    See unidecode_expect_ascii for the meaning of errors and replace_str.
+    Invalid UTF-8 sequences are handled like characters without a
+    replacement: 'ignore' drops them, 'replace' substitutes replace_str for
+    each sequence, 'preserve' keeps the original bytes and 'strict' raises
+    UnidecodeError. If errors is a function, it is called with the sequence
+    decoded with the 'surrogateescape' error handler. Indexes passed to the
+    function and in UnidecodeError are offsets in bytes.
+    """
+    # data is only copied if it is ASCII and not bytes already. Other
+    # buffers are searched for runs without a copy.
+    if _non_ascii_bytes_run.search(data) is None:
+        return bytes(data)
+
+    handler: Optional[ErrorHandler]
+    if callable(errors):
+        handler = errors
+        table = _get_handler_table()
+    else:
+        handler = None
+        table = _get_translation_table(errors, replace_str)
+
+    def translate_run(m: Match[bytes]) -> bytes:
+        if _max_sections is not None:
+            _touch_sections(m.group().decode('utf-8', 'ignore'))
+
+        # Most runs are valid UTF-8 with replacements for every character,
+        # so try the whole run first. Not while instrumentation is on, since
+        # characters without a replacement would then be reported twice.
+        if _instrumentation is None:
+            try:
+                repl = m.group().decode('utf-8').translate(table)
+            except (UnicodeDecodeError, _UnmappedCharacter):
+                pass
+            else:
+                if repl.isascii():
+                    return repl.encode('ascii')
+
+        return _translate_utf8(m.group(), m.start(), table, handler)
+
+    return _non_ascii_bytes_run.sub(translate_run, data)
+
+def unidecode_with_offsets(string: str, errors: Errors = 'ignore',
+        replace_str: str = '?') -> Tuple[str, 'array[int]']:
+    """Transliterate an Unicode object and map the result to the original
+
+    >>> unidecode_with_offsets("a\u5317b")
+    ('aBei b', array('I', [0, 1, 1, 1, 1, 2]))
+
+    Returns the transliterated string and an array of the same length. Item
+    i of the array is the index in string of the character that output
+    character i came from, so a match in the output can be highlighted in
+    the original text. See unidecode_expect_ascii for the meaning of errors
+    and replace_str.
+    """
+    if string.isascii():
+        return string, _index_range(0, len(string))
+
+    handler: Optional[ErrorHandler]
+    if callable(errors):
+        handler = errors
+        table = _get_handler_table()
+    else:
+        handler = None
+        table = _get_translation_table(errors, replace_str)
+
+    _touch_sections(string)
+
+    # Look up every character at once with map() instead of a loop, which is
+    # faster even though ASCII characters are looked up too.
+    try:
+        repls = list(map(table.__getitem__, map(ord, string)))
+    except _UnmappedCharacter as e:
+        char = e.char
+    else:
+        retval = ''.join(repls)
+
+        if handler is not None and not retval.isascii():
+            repls = [handler(char, index) if repl == char and char > '\x7f' else repl
+                    for index, (char, repl) in enumerate(zip(string, repls))]
+            retval = ''.join(repls)
+
+        lengths = list(map(len, repls))
+        if lengths.count(1) == len(lengths):
+            return retval, _index_range(0, len(string))
+
+        # Repeat the packed index of each character once for each character
+        # of its replacement.
+        offsets = array('I')
+        offsets.frombytes(b''.join(map(operator.mul, map(_pack_index, range(len(string))), lengths)))
+
+        return retval, offsets
+
+    raise _unmapped_error(string, char)
+
+def unidecode_stream(reader: BinaryIO, writer: TextIO, encoding: str = 'utf-8',
+        errors: Errors = 'ignore', replace_str: str = '?', chunk_size: int = 0x10000) -> None:
+    """Transliterate text read from a binary file object into a text file object
+
+    Input is read in chunks of chunk_size bytes and decoded with an
+    incremental decoder for encoding, so memory use doesn't depend on the
+    length of the input or its lines. Characters split between chunks are
+    decoded correctly.
+
+    UnicodeDecodeError is raised if the input can't be decoded, after the
+    text before the error is written. See unidecode_expect_ascii for the meaning of errors and replace_str. In the
+    'strict' mode, the index attribute of UnidecodeError is the position of
+    the character in the whole decoded input.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    handler: Optional[ErrorHandler]
+    if callable(errors):
+        handler = errors
+    else:
+        handler = None
+        table = _get_translation_table(errors, replace_str)
+
+    offset = 0
+    while True:
+        data = reader.read(chunk_size)
+        decode_error = None
+        try:
+            text = decoder.decode(data, final=not data)
+        except UnicodeDecodeError as e:
+            decode_error = e
+            text = _decode_before_error(decoder, data, e)
+
+        try:
+            if handler is not None:
+                writer.write(_unidecode_handler(text, handler, offset))
+            else:
+                _touch_sections(text)
+                writer.write(_non_ascii_run.sub(lambda m: m.group().translate(table), text))
+        except _UnmappedCharacter as e:
+            char = e.char
+            break
+
+        offset += len(text)
+
+        if decode_error is not None:
+            raise decode_error
+
+        if not data:
+            return
+
+    raise _unmapped_error(text, char, offset)
+
+def set_cache_policy(max_sections: Optional[int] = None) -> None:
+    """Limit the number of sections that are kept loaded.
+
+    If max_sections is not None, the least recently used section is
+    evicted when a new one is loaded and there are already max_sections
+    sections in the cache. Stored results for characters from the evicted
+    section are removed as well. This bounds memory use at the cost of
+    loading sections again when they are needed.
+    """
+    global _max_sections
+
+    if max_sections is not None and max_sections < 1:
+        raise ValueError('max_sections must be at least 1')
+
+    _max_sections = max_sections
+    _evict_sections()
+
+def set_string_cache(max_strings: Optional[int] = None, max_length: int = 256) -> None:
+    """Remember the results for up to max_strings input strings.
+
+    This helps when the same strings, like names of people or places, are
+    transliterated over and over. A string seen before is then looked up
+    once instead of character by character. The least recently used
+    results are discarded first. None disables the cache, which is the
+    default. Results are the same with and without the cache. Strings
+    transliterated with an errors function are not cached. The cache is
+    not used while instrumentation is on, so that every character without
+    a replacement is reported. Calling this again discards the cached
+    results.
+
+    Only strings of up to max_length characters are cached. Longer ones,
+    such as whole documents, rarely repeat and are transliterated each time
+    instead of being kept in memory. So are strings with surrogate
+    characters, so that each occurrence produces a warning.
+    """
+    global _string_cache, _max_string_length
+
+    if max_strings is not None and max_strings < 1:
+        raise ValueError('max_strings must be at least 1')
+    if max_length < 1:
+        raise ValueError('max_length must be at least 1')
+
+    _max_string_length = max_length
+
+    if max_strings is None:
+        _string_cache = None
+    else:
+        # lru_cache is safe to call from several threads at once.
+        _string_cache = functools.lru_cache(maxsize=max_strings)(_unidecode_uncached)
+
+def set_token_cache(max_tokens: Optional[int] = None, max_length: int = 32) -> None:
+    """Remember the results for up to max_tokens runs of non-ASCII
+    characters, such as words in Cyrillic text.
+
+    This helps with long documents, where the same words appear over and
+    over. The results for the runs are cached for each errors mode and
+    replace_str, and the least recently used ones are discarded first. None
+    disables the cache, which is the default. The result for the whole
+    string is the same with and without the cache. Calling this again
+    discards the cached results.
+
+    Only runs of up to max_length characters are cached. Longer runs, such
+    as whole paragraphs of Chinese text, which has no spaces, rarely repeat
+    and are translated each time instead of being kept in memory.
+    """
+    global _max_tokens, _max_token_length
+
+    if max_tokens is not None and max_tokens < 1:
+        raise ValueError('max_tokens must be at least 1')
+    if max_length < 1:
+        raise ValueError('max_length must be at least 1')
+
+    _max_tokens = max_tokens
+    _max_token_length = max_length
+
+    # Translation tables are created again with the new setting.
+    _translation_tables.clear()
+
+def cache_stats() -> Dict[str, int]:
+    """Return the number of cache hits, misses and evictions of sections and
+    the number of sections currently in the cache, as well as the hits,
+    misses and sizes of the caches set by set_string_cache() and
+    set_token_cache().
+
+    Sections are looked up when a character is seen for the first time.
+    With set_cache_policy(), each call also counts a hit for every loaded
+    section that its characters belong to.
+    """
+    stats = dict(_cache_stats)
+    stats['sections'] = len(Cache)
+
+    string_cache = _string_cache
+    if string_cache is not None:
+        info = string_cache.cache_info()  # type: ignore
+        stats.update(string_hits=info.hits, string_misses=info.misses, strings=info.currsize)
+    else:
+        stats.update(string_hits=0, string_misses=0, strings=0)
+
+    stats.update(token_hits=0, token_misses=0, tokens=0)
+    for table in list(_translation_tables.values()):
+        token_cache = table.token_cache
+        if token_cache is not None:
+            info = token_cache.cache_info()
+            stats['token_hits'] += info.hits
+            stats['token_misses'] += info.misses
+            stats['tokens'] += info.currsize
+
+    return stats
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]) -> None:
+    """Start reporting events to an Instrumentation object, or stop if
+    instrumentation is None."""
+    global _instrumentation
+
+    _instrumentation = instrumentation
+
+    # Translation tables remember results for characters without a
+    # replacement. Start with empty ones so that each such character is
+    # seen by on_unmapped().
+    _translation_tables.clear()
+    if _string_cache is not None:
+        _string_cache.cache_clear()  # type: ignore
+
+def preload(sections: Optional[Iterable[int]] = None, freeze: bool = True) -> None:
+    """Load replacement tables eagerly instead of on first use.
+
+    sections is an iterable of section numbers (code point >> 8) to load.
+    By default all sections are loaded.
+
+    If freeze is true, gc.freeze() is called afterwards so that the loaded
+    tables, and all other objects existing at that point, are ignored by the
+    garbage collector. Call this in a pre-forking server's master process so
+    that workers share the tables in copy-on-write memory instead of each
+    loading them again.
+    """
+    if sections is None:
+        tables = _open_packed_tables()
+        if tables is not None:
+            sections = range(tables.n_sections)
+        else:
+            sections = module_sections()
+
+    for section in sections:
+        if section not in Cache:
+            _cache_section(section)
+
+    if freeze:
+        gc.freeze()
+
+def loaded_sections() -> List[int]:
+    """Return a sorted list of sections that have their tables loaded."""
+    return sorted(section for section, table in Cache.items() if table is not None)
+
+def share_tables() -> str:
+    """Copy the replacement tables into a shared memory block and return its
+    name.
+
+    Pass the name to attach_tables() in worker processes, for example with
+    multiprocessing.Pool(initializer=attach_tables, initargs=(name,)).
+    Workers then look up replacements in the shared block, so memory use
+    doesn't grow with the number of workers and they don't import the
+    tables. The block is created once; later calls return the same name.
+    Call unshare_tables() to free it when the workers are done. This
+    requires Python 3.8 or later.
+    """
+    global _shared_memory
+
+    with _packed_tables_lock:
+        if _shared_memory is None:
+            tables = _open_packed_tables_locked()
+            data = tables.data() if tables is not None else pack_tables()
+            _shared_memory = create_shared_block(data)
+
+        return _shared_memory.name
+
+def unshare_tables() -> None:
+    """Free the shared memory block created by share_tables(). Processes
+    that attached to it keep their mapping until they exit."""
+    global _shared_memory
+
+    with _packed_tables_lock:
+        if _shared_memory is not None:
+            _shared_memory.close()
+            _shared_memory.unlink()
+            _shared_memory = None
+
+def attach_tables(name: str) -> None:
+    """Look up replacements in the shared memory block created by
+    share_tables() in another process."""
+    global _packed_tables, _packed_tables_opened
+
+    tables = PackedTables.attach(name)
+
+    with _packed_tables_lock:
+        _packed_tables = tables
+        _packed_tables_opened = True
+
+    # Drop anything looked up in tables used before.
+    with _cache_lock:
+        Cache.clear()
+    _translation_tables.clear()
+
+def memory_report() -> Dict[str, int]:
+    """Return sizes in bytes and counts of objects used by the replacement
+    tables, for measuring memory use.
+
+    With the packed tables file, the report includes the file size, the
+    number of table entries and distinct replacement strings, and the
+    number and size of replacement strings decoded so far. Each distinct
+    string is stored and decoded only once. When tables are imported from
+    xNNN modules, it includes the size of the loaded tuples and strings.
+    In both cases, it includes the size of the translation tables that
+    hold the results for characters seen so far.
+    """
+    report = {
+        'sections_loaded': len(loaded_sections()),
+        'translation_table_entries': sum(len(t) for t in _translation_tables.values()),
+        'translation_table_bytes': sum(sys.getsizeof(t) for t in _translation_tables.values()),
+    }
+
+    tables = _open_packed_tables()
+    if tables is not None:
+        report.update(tables.stats())
+    else:
+        loaded = [table for table in Cache.values() if table is not None]
+        strings = {id(s): s for table in loaded for s in table if s}
+
+        report['table_bytes'] = sum(sys.getsizeof(table) for table in loaded)
+        report['distinct_strings'] = len(strings)
+        report['string_bytes'] = sum(sys.getsizeof(s) for s in strings.values())
+
+    return report
+
 def _get_repl_str(char: str) -> Optional[str]:
     codepoint = ord(char)
 
@@ -87,9 +682,19 @@ def _get_repl_str(char: str) -> Optional[str]:
 
     if codepoint > 0xeffff:
         # No data on characters in Private Use Area and above.
+        if _instrumentation is not None:
+            _instrumentation.on_section_miss(codepoint >> 8)
         return None
 
+    if hangul.FIRST <= codepoint <= hangul.LAST:
+        return hangul.syllable(codepoint)
+
+    if mathematical.FIRST <= codepoint <= mathematical.LAST:
+        return mathematical.replacement(codepoint)
+
     if 0xd800 <= codepoint <= 0xdfff:
+        if _instrumentation is not None:
+            _instrumentation.on_surrogate(char)
         warnings.warn(  "Surrogate character %r will be ignored. "
                         "You might be using a narrow Python build." % (char,),
                         RuntimeWarning, 2)
@@ -100,39 +705,432 @@ def _get_repl_str(char: str) -> Optional[str]:
     try:
         table = Cache[section]
     except KeyError:
-        try:
-            mod = __import__('unidecode.x%03x'%(section), globals(), locals(), ['data'])
-        except ImportError:
-            # No data on this character
-            Cache[section] = None
-            return None
-
-        Cache[section] = table = mod.data
+        _cache_stats['misses'] += 1
+        table = _cache_section(section)
+    else:
+        _cache_stats['hits'] += 1
 
     if table and len(table) > position:
         return table[position]
     else:
+        if table is None and _instrumentation is not None:
+            _instrumentation.on_section_miss(section)
         return None
 
-def _unidecode(string: str, errors: str, replace_str:str) -> str:
-    retval = []
+def _cache_section(section: int) -> Optional[Sequence[Optional[str]]]:
+    lock = _section_locks.setdefault(section, threading.Lock())
+
+    with lock:
+        # Another thread might have loaded the section while this one was
+        # waiting for the lock.
+        try:
+            return Cache[section]
+        except KeyError:
+            pass
+
+        if _instrumentation is None:
+            table = _load_section(section)
+        else:
+            start = time.perf_counter()
+            table = _load_section(section)
+            if table is not None:
+                _instrumentation.on_section_load(section, time.perf_counter() - start)
+
+        # Inserting changes the order of Cache, like moving and evicting.
+        with _cache_lock:
+            Cache[section] = table
+
+    _evict_sections()
+
+    return table
+
+def _touch_sections(string: str) -> None:
+    """Move the sections of the characters in string to the end of Cache as
+    the most recently used, if Cache is bounded.
+
+    Characters that are already in a translation table don't reach
+    _get_repl_str(), so this is done for each call instead.
+    """
+    if _max_sections is None:
+        return
 
-    for index, char in enumerate(string):
+    sections = {codepoint >> 8 for codepoint in set(map(ord, string)) if codepoint > 0x7f}
+
+    with _cache_lock:
+        for section in sections:
+            # Sections that aren't loaded yet are added at the end when
+            # they are.
+            if section in Cache:
+                # Reordering never removes the section, so threads reading
+                # Cache without the lock don't load it again.
+                Cache.move_to_end(section)
+                _cache_stats['hits'] += 1
+
+def _evict_sections() -> None:
+    if _max_sections is None:
+        return
+
+    with _cache_lock:
+        while len(Cache) > _max_sections:
+            # The first section is the least recently used.
+            section, _ = Cache.popitem(last=False)
+            _cache_stats['evictions'] += 1
+
+            first = section << 8
+            for table in list(_translation_tables.values()):
+                for codepoint in range(first, first + 0x100):
+                    table.pop(codepoint, None)
+
+def _open_packed_tables() -> Optional[PackedTables]:
+    if not _packed_tables_opened:
+        with _packed_tables_lock:
+            return _open_packed_tables_locked()
+
+    return _packed_tables
+
+def _open_packed_tables_locked() -> Optional[PackedTables]:
+    # Must be called with _packed_tables_lock held.
+    global _packed_tables, _packed_tables_opened
+
+    if not _packed_tables_opened:
+        _packed_tables = open_tables()
+        _packed_tables_opened = True
+
+    return _packed_tables
+
+def _load_section(section: int) -> Optional[Sequence[Optional[str]]]:
+    tables = _open_packed_tables()
+    if tables is not None:
+        return tables.section(section)
+
+    try:
+        mod = __import__('unidecode.x%03x'%(section), globals(), locals(), ['data'])
+    except ImportError:
+        # No data on this character
+        return None
+
+    return mod.data
+
+class _UnmappedCharacter(Exception):
+    """Raised from a translation table for a character that has no
+    replacement, when errors='strict' or errors has an invalid value."""
+
+    def __init__(self, char: str) -> None:
+        super(_UnmappedCharacter, self).__init__(char)
+        self.char = char
+
+class _TranslationTable(dict):
+    """Mapping from code points to replacement strings for use with
+    str.translate().
+
+    Entries are filled lazily from the section tables the first time a
+    character is seen. Characters without a replacement are resolved
+    according to the errors mode the table was made for.
+    """
+
+    def __init__(self, errors: str, replace_str: str, reported_errors: Optional[str] = None) -> None:
+        super(_TranslationTable, self).__init__()
+        self.errors = errors
+        # errors mode passed to Instrumentation.on_unmapped()
+        self.reported_errors = reported_errors or errors
+        self.replace_str = replace_str
+
+        # The errors mode is resolved once here instead of for each
+        # character without a replacement.
+        handlers = {
+            'ignore': self._ignore,
+            'strict': self._strict,
+            'replace': self._replace,
+            'preserve': self._preserve,
+        }
+
+        if errors not in handlers:
+            raise UnidecodeError('invalid value for errors parameter %r' % (errors,))
+
+        self._unmapped = handlers[errors]
+
+        # Translates a run of non-ASCII characters with this table. Results
+        # aren't cached while instrumentation is on, so that each unmapped
+        # character is still reported.
+        translate: Callable[[str], str] = operator.methodcaller('translate', self)
+        self.translate_run = translate
+        self.token_cache: 'Optional[functools._lru_cache_wrapper[str]]' = None
+
+        if _max_tokens is not None and _instrumentation is None:
+            token_cache = self.token_cache = functools.lru_cache(maxsize=_max_tokens)(translate)
+            max_length = _max_token_length
+
+            def translate_run(run: str) -> str:
+                if len(run) <= max_length:
+                    return token_cache(run)
+                return translate(run)
+
+            self.translate_run = translate_run
+
+    def __missing__(self, codepoint: int) -> Optional[str]:
+        char = chr(codepoint)
         repl = _get_repl_str(char)
 
         if repl is None:
-            if errors == 'ignore':
-                repl = ''
-            elif errors == 'strict':
-                raise UnidecodeError('no replacement found for character %r '
-                        'in position %d' % (char, index), index)
-            elif errors == 'replace':
-                repl = replace_str
-            elif errors == 'preserve':
-                repl = char
-            else:
-                raise UnidecodeError('invalid value for errors parameter %r' % (errors,))
+            if _instrumentation is not None:
+                _instrumentation.on_unmapped(char, self.reported_errors)
+
+                # Don't store the result so that each occurrence is counted.
+                return self._unmapped(char)
+
+            repl = self._unmapped(char)
+
+        # Surrogates are not stored so that each one produces a warning in
+        # _get_repl_str, like characters in any other position would.
+        if not 0xd800 <= codepoint <= 0xdfff:
+            self[codepoint] = repl
 
+        return repl
+
+    def _ignore(self, char: str) -> str:
+        return ''
+
+    def _replace(self, char: str) -> str:
+        return self.replace_str
+
+    def _preserve(self, char: str) -> str:
+        return char
+
+    def _strict(self, char: str) -> str:
+        # The caller knows the position of the character and raises
+        # UnidecodeError or calls the errors handler.
+        raise _UnmappedCharacter(char)
+
+_translation_tables: Dict[Tuple[str, Optional[str]], _TranslationTable] = {}
+
+def _get_translation_table(errors: str, replace_str: str) -> _TranslationTable:
+    if errors != 'replace':
+        # replace_str only matters for the 'replace' mode. Don't make
+        # separate tables for it otherwise.
+        replace_str = ''
+
+    key = (errors, replace_str)
+
+    try:
+        return _translation_tables[key]
+    except KeyError:
+        pass
+
+    # This raises UnidecodeError if errors is invalid, so that it is
+    # detected before any character is translated.
+    table = _TranslationTable(errors, replace_str)
+    return _translation_tables.setdefault(key, table)
+
+# _get_translation_table() never makes this key, since replace_str is a str.
+_handler_table_key = ('preserve', None)
+
+def _get_handler_table() -> _TranslationTable:
+    """Return the table used with errors functions. It keeps characters
+    without a replacement, which are then passed to the function."""
+    try:
+        return _translation_tables[_handler_table_key]
+    except KeyError:
+        pass
+
+    table = _TranslationTable('preserve', '', reported_errors='callable')
+    return _translation_tables.setdefault(_handler_table_key, table)
+
+_non_ascii_run = re.compile('[^\x00-\x7f]+')
+_ascii_split = re.compile('([^\x00-\x7f]+)').split
+
+# Replacements for U+0000 to U+00FF, indexed by code point
+_latin1_table: Optional[List[Optional[str]]] = None
+
+def _latin1_dense(string: str) -> bool:
+    # True if at least 1 in 32 characters is non-ASCII. Below that, the
+    # Latin-1 fast path is slower than copying ASCII runs.
+    return (len(string) - len(string.encode('ascii', 'ignore'))) * 32 >= len(string)
+
+def _get_latin1_table() -> List[Optional[str]]:
+    global _latin1_table
+
+    _latin1_table = [_get_repl_str(chr(codepoint)) for codepoint in range(0x100)]
+    return _latin1_table
+
+def _unidecode(string: str, errors: Errors, replace_str: str, split_ascii: bool = False) -> str:
+    if callable(errors):
+        return _unidecode_handler(string, errors)
+
+    string_cache = _string_cache
+    if string_cache is not None and _instrumentation is None and _cacheable(string):
+        return string_cache(string, errors, replace_str)
+
+    return _unidecode_uncached(string, errors, replace_str, split_ascii)
+
+_surrogate_search = re.compile('[\ud800-\udfff]').search
+
+def _cacheable(string: str) -> bool:
+    # Long strings rarely repeat and would keep a lot of memory in the
+    # cache. Strings with surrogates are translated each time so that every
+    # occurrence produces a warning.
+    return len(string) <= _max_string_length and _surrogate_search(string) is None
+
+def _unidecode_uncached(string: str, errors: str, replace_str: str, split_ascii: bool = True) -> str:
+    table = _get_translation_table(errors, replace_str)
+
+    if len(string.encode('latin-1', 'ignore')) == len(string):
+        # Every character is below U+0100. Section 0x00 has a replacement for
+        # all of them, so errors doesn't matter and the regular expression
+        # and section lookups can be skipped. This looks up every character
+        # though, so copying ASCII runs is faster when accented characters
+        # are sparse, like names in English text.
+        if not split_ascii or _latin1_dense(string):
+            return string.translate(_latin1_table or _get_latin1_table())
+
+    _touch_sections(string)
+
+    try:
+        if split_ascii or _max_tokens is not None:
+            # Every other part is a run of non-ASCII characters, which are
+            # translated separately. ASCII parts are kept as they are.
+            parts = _ascii_split(string)
+            parts[1::2] = map(table.translate_run, parts[1::2])
+            return ''.join(parts)
+        else:
+            return string.translate(table)
+    except _UnmappedCharacter as e:
+        char = e.char
+
+    raise _unmapped_error(string, char)
+
+def _unidecode_handler(string: str, handler: ErrorHandler, offset: int = 0) -> str:
+    """Transliterate string, calling handler for characters without a
+    replacement. offset is added to the index passed to handler."""
+    # Replacements are ASCII, so with 'preserve' any non-ASCII character left
+    # in the result is one without a replacement. This avoids raising an
+    # exception for each of them, which is slow on emoji-heavy text.
+    table = _get_handler_table()
+    _touch_sections(string)
+
+    def translate_run(m: Match[str]) -> str:
+        # While instrumentation is on, translating the whole run first would
+        # report characters without a replacement twice.
+        if _instrumentation is None:
+            repl = m.group().translate(table)
+            if repl.isascii():
+                return repl
+
+        retval = []
+        for index, char in enumerate(m.group(), offset + m.start()):
+            repl = table[ord(char)]
+            if repl == char:
+                repl = handler(char, index)
+            retval.append(repl)
+
+        return ''.join(retval)
+
+    return _non_ascii_run.sub(translate_run, string)
+
+_non_ascii_bytes_run = re.compile(b'[\x80-\xff]+')
+
+def _mark_invalid_utf8(e: UnicodeError) -> Tuple[str, int]:
+    # Replaces an invalid sequence with a surrogate that gives its length in
+    # bytes. Valid UTF-8 never decodes to a surrogate, so these can't be
+    # confused with characters in the input.
+    assert isinstance(e, UnicodeDecodeError)
+    return chr(0xd800 + e.end - e.start), e.end
+
+codecs.register_error('unidecode.mark_invalid', _mark_invalid_utf8)
+
+_split_invalid_utf8 = re.compile('([\ud801-\udbff])').split
+
+def _translate_utf8(run: bytes, offset: int, table: _TranslationTable,
+        handler: Optional[ErrorHandler]) -> bytes:
+    """Transliterate a run of non-ASCII bytes at offset in the input."""
+    # The run is decoded once, so the time taken is linear in its length
+    # however many invalid sequences it contains. Every other part is an
+    # invalid sequence.
+    parts = _split_invalid_utf8(run.decode('utf-8', 'unidecode.mark_invalid'))
+
+    retval = [_translate_utf8_text(parts[0], offset, table, handler)]
+    pos = len(parts[0].encode('utf-8'))
+
+    for i in range(1, len(parts), 2):
+        end = pos + ord(parts[i]) - 0xd800
+        retval.append(_invalid_utf8(run[pos:end], offset + pos, table, handler))
+
+        retval.append(_translate_utf8_text(parts[i + 1], offset + end, table, handler))
+        pos = end + len(parts[i + 1].encode('utf-8'))
+
+    return b''.join(retval)
+
+def _translate_utf8_text(text: str, offset: int, table: _TranslationTable,
+        handler: Optional[ErrorHandler]) -> bytes:
+    if handler is None:
+        try:
+            return text.translate(table).encode('utf-8')
+        except _UnmappedCharacter as e:
+            char = e.char
+
+        index = offset + len(text[:text.index(char)].encode('utf-8'))
+        raise _no_replacement_error(char, index)
+
+    if _instrumentation is None:
+        repl = text.translate(table)
+        if repl.isascii():
+            return repl.encode('ascii')
+
+    retval = []
+    index = offset
+    for char in text:
+        repl = table[ord(char)]
+        if repl == char:
+            repl = handler(char, index)
         retval.append(repl)
+        index += len(char.encode('utf-8'))
+
+    return ''.join(retval).encode('utf-8')
+
+def _invalid_utf8(seq: bytes, index: int, table: _TranslationTable,
+        handler: Optional[ErrorHandler]) -> bytes:
+    if handler is not None:
+        return handler(seq.decode('utf-8', 'surrogateescape'), index).encode('utf-8')
+    elif table.errors == 'ignore':
+        return b''
+    elif table.errors == 'replace':
+        return table.replace_str.encode('utf-8')
+    elif table.errors == 'preserve':
+        return seq
+    else:
+        raise UnidecodeError('invalid UTF-8 sequence %r in position %d' % (seq, index), index)
+
+# array('I', range(n)), grown as needed up to _max_identity items. Slicing
+# it is much faster than building an array from a range.
+_identity = array('I')
+_max_identity = 0x10000
+
+_pack_index = struct.Struct('I').pack
+
+def _index_range(start: int, stop: int) -> 'array[int]':
+    global _identity
+
+    if stop > _max_identity:
+        # Don't keep memory for long strings after they are done.
+        return array('I', range(start, stop))
+
+    identity = _identity
+    if stop > len(identity):
+        identity = _identity = array('I', range(min(max(stop, 2 * len(identity)), _max_identity)))
+
+    return identity[start:stop]
+
+def _decode_before_error(decoder: codecs.IncrementalDecoder, data: bytes, e: UnicodeDecodeError) -> str:
+    """Decode the part of data before the error e, which was raised when
+    decoder decoded data, so that it can be written before e is raised."""
+    # e.object starts with the bytes that decoder kept from earlier data.
+    end = e.start - (len(e.object) - len(data))
+    return decoder.decode(data[:max(end, 0)])
+
+def _unmapped_error(string: str, char: str, offset: int = 0) -> UnidecodeError:
+    # Translation is done from left to right, so the first occurrence of the
+    # character is the one that could not be translated.
+    return _no_replacement_error(char, string.index(char) + offset)
 
-    return ''.join(retval)
+def _no_replacement_error(char: str, index: int) -> UnidecodeError:
+    return UnidecodeError('no replacement found for character %r '
+            'in position %d' % (char, index), index)
@@ -0,0 +1,95 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+"""Codec that transliterates Unicode text into ASCII bytes.
+
+Importing this module registers the 'unidecode' codec:
+
+>>> import unidecode.codec
+>>> "Κνωσός".encode("unidecode")
+b'Knosos'
+
+It can be used anywhere an encoding is accepted, for example with
+open(path, "w", encoding="unidecode").
+
+Characters without a replacement are passed to the codec error handler, as
+with any other codec. The default 'strict' handler raises
+UnicodeEncodeError, 'ignore' and 'replace' behave like the same errors
+modes of unidecode(). Decoding is the same as for the 'ascii' codec.
+"""
+import codecs
+from typing import Any, List, Optional, Tuple
+
+from unidecode import _get_translation_table, _touch_sections, _UnmappedCharacter
+
+NAME = 'unidecode'
+
+# Any bytes-like object. This is Buffer in typeshed, which is not available
+# in the typing module on older versions of Python.
+ReadableBuffer = Any
+
+def encode(input: str, errors: str = 'strict') -> Tuple[bytes, int]:
+    table = _get_translation_table('strict', '')
+    _touch_sections(input)
+
+    try:
+        return input.translate(table).encode('ascii'), len(input)
+    except _UnmappedCharacter:
+        pass
+
+    handler = codecs.lookup_error(errors)
+
+    retval: List[bytes] = []
+    pos = 0
+
+    while True:
+        try:
+            retval.append(input[pos:].translate(table).encode('ascii'))
+            break
+        except _UnmappedCharacter as e:
+            index = input.index(e.char, pos)
+
+        retval.append(input[pos:index].translate(table).encode('ascii'))
+
+        exc = UnicodeEncodeError(NAME, input, index, index + 1, 'no replacement found')
+        repl, pos = handler(exc)
+        if pos < 0:
+            pos += len(input)
+
+        if isinstance(repl, str):
+            repl = repl.encode('ascii')
+        retval.append(repl)
+
+    return b''.join(retval), len(input)
+
+def decode(input: ReadableBuffer, errors: str = 'strict') -> Tuple[str, int]:
+    return codecs.ascii_decode(input, errors)
+
+class IncrementalEncoder(codecs.IncrementalEncoder):
+    def encode(self, input: str, final: bool = False) -> bytes:
+        return encode(input, self.errors)[0]
+
+class IncrementalDecoder(codecs.IncrementalDecoder):
+    def decode(self, input: ReadableBuffer, final: bool = False) -> str:
+        return decode(input, self.errors)[0]
+
+class StreamWriter(codecs.StreamWriter):
+    def encode(self, input: str, errors: str = 'strict') -> Tuple[bytes, int]:
+        return encode(input, errors)
+
+class StreamReader(codecs.StreamReader):
+    def decode(self, input: ReadableBuffer, errors: str = 'strict') -> Tuple[str, int]:
+        return decode(input, errors)
+
+def search(name: str) -> Optional[codecs.CodecInfo]:
+    if name != NAME:
+        return None
+
+    return codecs.CodecInfo(
+            name=NAME,
+            encode=encode,
+            decode=decode,
+            incrementalencoder=IncrementalEncoder,
+            incrementaldecoder=IncrementalDecoder,
+            streamwriter=StreamWriter,
+            streamreader=StreamReader)
+
+codecs.register(search)
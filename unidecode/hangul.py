@@ -0,0 +1,39 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+"""Transliteration of precomposed Hangul syllables (U+AC00 to U+D7A3).
+
+Each syllable is composed of a leading consonant, a vowel and an optional
+trailing consonant. Its index from U+AC00 is
+
+    (lead * VOWEL_COUNT + vowel) * TRAIL_COUNT + trail
+
+so the replacement is computed from these small tables instead of being
+stored for each of the 11172 syllables.
+"""
+
+FIRST = 0xac00
+LAST = 0xd7a3
+
+LEAD = (
+'g', 'gg', 'n', 'd', 'dd', 'r', 'm', 'b', 'bb', 's', 'ss', '', 'j', 'jj',
+'c', 'k', 't', 'p', 'h',
+)
+
+VOWEL = (
+'a', 'ae', 'ya', 'yae', 'eo', 'e', 'yeo', 'ye', 'o', 'wa', 'wae', 'oe', 'yo',
+'u', 'weo', 'we', 'wi', 'yu', 'eu', 'yi', 'i',
+)
+
+TRAIL = (
+'', 'g', 'gg', 'gs', 'n', 'nj', 'nh', 'd', 'l', 'lg', 'lm', 'lb', 'ls', 'lt',
+'lp', 'lh', 'm', 'b', 'bs', 's', 'ss', 'ng', 'j', 'c', 'k', 't', 'p', 'h',
+)
+
+VOWEL_COUNT = len(VOWEL)
+TRAIL_COUNT = len(TRAIL)
+
+def syllable(codepoint: int) -> str:
+    """Return the replacement for the Hangul syllable at codepoint."""
+    index = codepoint - FIRST
+    lead, index = divmod(index, VOWEL_COUNT * TRAIL_COUNT)
+    vowel, trail = divmod(index, TRAIL_COUNT)
+    return LEAD[lead] + VOWEL[vowel] + TRAIL[trail]
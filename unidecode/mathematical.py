@@ -0,0 +1,55 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+"""Transliteration of Mathematical Alphanumeric Symbols (U+1D400 to U+1D7FF).
+
+These are styled (bold, italic, script, ...) variants of Latin and Greek
+letters and digits, laid out in regular ranges. Each range is described by
+its first and last code point and the sequence of replacements that repeats
+over it, one for each style.
+"""
+from typing import Optional
+
+FIRST = 0x1d400
+LAST = 0x1d7ff
+
+LATIN = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz'
+
+GREEK = (
+'Alpha', 'Beta', 'Gamma', 'Delta', 'Epsilon', 'Zeta', 'Eta', 'Theta', 'Iota',
+'Kappa', 'Lamda', 'Mu', 'Nu', 'Xi', 'Omicron', 'Pi', 'Rho', 'Theta', 'Sigma',
+'Tau', 'Upsilon', 'Phi', 'Chi', 'Psi', 'Omega', 'nabla', 'alpha', 'beta',
+'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'iota', 'kappa', 'lamda',
+'mu', 'nu', 'xi', 'omicron', 'pi', 'rho', 'sigma', 'sigma', 'tau', 'upsilon',
+'phi', 'chi', 'psi', 'omega',
+)
+
+DIGITS = '0123456789'
+
+RANGES = (
+    # Latin letters in 13 styles
+    (0x1d400, 0x1d6a3, LATIN),
+    # Dotless i and j
+    (0x1d6a4, 0x1d6a5, 'ij'),
+    # Bold Greek letters. Other styles have no replacements.
+    (0x1d6a8, 0x1d6a8 + len(GREEK) - 1, GREEK),
+    # Digits in 5 styles
+    (0x1d7ce, 0x1d7ff, DIGITS),
+)
+
+# Code points in the Latin ranges that are not assigned, because the letter
+# was encoded earlier in the Letterlike Symbols block.
+HOLES = frozenset((
+    0x1d455, 0x1d49d, 0x1d4a0, 0x1d4a1, 0x1d4a3, 0x1d4a4, 0x1d4a7, 0x1d4a8,
+    0x1d4ad, 0x1d4ba, 0x1d4bc, 0x1d4c4, 0x1d506, 0x1d50b, 0x1d50c, 0x1d515,
+    0x1d51d, 0x1d53a, 0x1d53f, 0x1d545, 0x1d547, 0x1d548, 0x1d549, 0x1d551,
+))
+
+def replacement(codepoint: int) -> Optional[str]:
+    """Return the replacement for a code point in this block, or None."""
+    if codepoint in HOLES:
+        return None
+
+    for first, last, repl in RANGES:
+        if first <= codepoint <= last:
+            return repl[(codepoint - first) % len(repl)]
+
+    return None
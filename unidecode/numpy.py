@@ -0,0 +1,74 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+"""Transliterate NumPy arrays of strings.
+
+This module requires NumPy, which is not a dependency of Unidecode itself:
+
+>>> import numpy as np
+>>> from unidecode.numpy import unidecode_array
+>>> unidecode_array(np.array(['Zoë', 'Kraków', 'Hello']))
+array(['Zoe', 'Krakow', 'Hello'], dtype='<U6')
+
+Arrays with a fixed-width unicode ('U') dtype store each element as UCS-4
+code points. Elements with a non-ASCII code point are found with a single
+reduction over that buffer, so only those are converted to Python strings
+and transliterated. ASCII elements are copied as they are.
+"""
+from typing import Any
+
+import numpy as np
+
+from unidecode import Errors, unidecode_many
+
+def unidecode_array(array: Any, errors: Errors = 'ignore', replace_str: str = '?') -> np.ndarray:
+    """Transliterate each element of an array of strings
+
+    array must have a 'U' or object dtype. For a 'U' array, the result has a
+    'U' dtype that is wide enough for the longest result, and at least as
+    wide as the original. For an object array, the result is an object
+    array. Elements that are not str are copied unchanged.
+
+    See unidecode.unidecode_expect_ascii for the meaning of errors and
+    replace_str. In the 'strict' mode, the index attribute of
+    UnidecodeError is the position in the element that could not be
+    transliterated.
+    """
+    array = np.asarray(array)
+
+    if array.dtype.kind == 'U':
+        return _unidecode_unicode(array, errors, replace_str)
+    elif array.dtype.kind == 'O':
+        return _unidecode_object(array, errors, replace_str)
+    else:
+        raise TypeError("expected an array with a 'U' or object dtype, got %s" % (array.dtype,))
+
+def _unidecode_unicode(array: np.ndarray, errors: Errors, replace_str: str) -> np.ndarray:
+    width = array.dtype.itemsize // 4
+    if width == 0 or array.size == 0:
+        return array.copy()
+
+    # View the elements as rows of code points in native byte order.
+    shape = array.shape
+    array = np.asarray(array, dtype=array.dtype.newbyteorder('='), order='C').reshape(-1)
+    codepoints = array.view(np.uint32).reshape(array.size, width)
+    nonascii = codepoints.max(axis=1) > 0x7f
+
+    repls = unidecode_many(array[nonascii].tolist(), errors, replace_str)
+
+    width = max([width] + [len(repl) for repl in repls])
+    retval = array.astype('U%d' % (width,))
+    retval[nonascii] = repls
+
+    return retval.reshape(shape)
+
+def _unidecode_object(array: np.ndarray, errors: Errors, replace_str: str) -> np.ndarray:
+    items = array.ravel().tolist()
+
+    indexes = [i for i, item in enumerate(items) if isinstance(item, str) and not item.isascii()]
+    repls = unidecode_many([items[i] for i in indexes], errors, replace_str)
+    for i, repl in zip(indexes, repls):
+        items[i] = repl
+
+    retval = np.empty(len(items), dtype=object)
+    retval[:] = items
+
+    return retval.reshape(array.shape)
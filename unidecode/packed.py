@@ -0,0 +1,296 @@
+# vim:ts=4 sw=4 expandtab softtabstop=4
+"""Replacement tables packed into a single memory-mapped file.
+
+The xNNN modules are the source of the transliteration data. At build time
+they are packed into one file that is shipped as package data:
+
+    header      magic, number of sections, number of bitmaps, number of
+                entries
+    sections    (first entry, table length, bitmap) for each section
+    bitmaps     two 256-bit bitmaps for each section that has a table. The
+                first has a bit set for each position that has a
+                replacement (not None), the second for each position that
+                has a non-empty replacement.
+    entries     (offset, length) in the blob of each non-empty replacement
+    blob        ASCII replacement strings. Each distinct string is stored
+                only once.
+
+Only non-empty replacements have an entry. This makes the file smaller,
+since many positions in the tables are None or empty strings. The index of
+the entry for a position is the number of bits set below it in the second
+bitmap.
+
+At run time the file is memory-mapped and replacement strings are decoded
+only when they are looked up. Sections don't need to be imported and no
+tuples are created for them.
+
+The file is written by the build_py step in setup.py. When it is missing,
+for example in a source checkout, sections are imported from the xNNN
+modules instead.
+
+The same data can also be copied into a shared memory block, so that worker
+processes look up replacements in one copy instead of each importing the
+modules.
+"""
+import mmap
+import os
+import pkgutil
+import re
+import struct
+import sys
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Sequence, Tuple, Union, overload
+
+if TYPE_CHECKING:
+    from multiprocessing.shared_memory import SharedMemory
+
+TABLES_FILE = 'tables.bin'
+
+MAGIC = b'UNIDCTB2'
+
+_header = struct.Struct('<8sIII')
+_section = struct.Struct('<IHH')
+_entry = struct.Struct('<IB')
+
+BITMAP_SIZE = 32
+
+def module_sections() -> List[int]:
+    """Return the sections that have an xNNN module, in ascending order."""
+    import unidecode
+
+    sections = []
+    for info in pkgutil.iter_modules(unidecode.__path__):
+        if re.match('^x[0-9a-f]{3}$', info.name):
+            sections.append(int(info.name[1:], 16))
+
+    return sorted(sections)
+
+def _iter_modules() -> Iterator[Tuple[int, Sequence[Optional[str]]]]:
+    """Yield (section, data) for all xNNN modules in the package."""
+    for section in module_sections():
+        mod = __import__('unidecode.x%03x' % (section,), globals(), locals(), ['data'])
+        yield section, mod.data
+
+def pack_tables() -> bytes:
+    """Pack the data from all xNNN modules into the binary format."""
+    tables = dict(_iter_modules())
+
+    n_sections = max(tables) + 1 if tables else 0
+
+    sections = []
+    bitmaps: List[bytes] = []
+    entries: List[bytes] = []
+    blob = bytearray()
+
+    # Offsets of strings already in the blob
+    offsets: Dict[bytes, int] = {}
+
+    for section in range(n_sections):
+        data = tables.get(section, ())
+        if not data:
+            sections.append(_section.pack(0, 0, 0))
+            continue
+
+        sections.append(_section.pack(len(entries), len(data), len(bitmaps) // 2))
+
+        present = 0
+        nonempty = 0
+        for position, repl in enumerate(data):
+            if repl is None:
+                continue
+
+            present |= 1 << position
+            if not repl:
+                continue
+
+            nonempty |= 1 << position
+
+            b = repl.encode('ascii')
+            if len(b) > 0xff:
+                raise ValueError('replacement %r in section 0x%03x is too long' % (repl, section))
+
+            offset = offsets.get(b)
+            if offset is None:
+                offsets[b] = offset = len(blob)
+                blob += b
+
+            entries.append(_entry.pack(offset, len(b)))
+
+        bitmaps.append(present.to_bytes(BITMAP_SIZE, 'little'))
+        bitmaps.append(nonempty.to_bytes(BITMAP_SIZE, 'little'))
+
+    header = _header.pack(MAGIC, n_sections, len(bitmaps) // 2, len(entries))
+
+    return b''.join([header] + sections + bitmaps + entries + [bytes(blob)])
+
+def write_tables(path: str) -> None:
+    """Write packed tables to the file at path."""
+    with open(path, 'wb') as f:
+        f.write(pack_tables())
+
+class PackedSection(Sequence[Optional[str]]):
+    """Read-only view of one section in the packed tables. Behaves like the
+    data tuple from the corresponding xNNN module."""
+
+    def __init__(self, tables: 'PackedTables', offset: int, length: int,
+            present: int, nonempty: int) -> None:
+        self._tables = tables
+        self._offset = offset
+        self._length = length
+        self._present = present
+        self._nonempty = nonempty
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, position: int) -> Optional[str]: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> List[Optional[str]]: ...
+
+    def __getitem__(self, position):
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._length))]
+
+        if position < 0:
+            position += self._length
+        if not 0 <= position < self._length:
+            raise IndexError('section index out of range')
+
+        bit = 1 << position
+        if not self._present & bit:
+            return None
+        if not self._nonempty & bit:
+            return ''
+
+        index = bin(self._nonempty & (bit - 1)).count('1')
+
+        return self._tables.string(self._offset + index * _entry.size)
+
+class PackedTables:
+    """Replacement tables in a memory-mapped packed file or shared memory
+    block."""
+
+    def __init__(self, buf: Union[mmap.mmap, memoryview]) -> None:
+        magic, self.n_sections, n_bitmaps, n_entries = _header.unpack_from(buf, 0)
+        if magic != MAGIC:
+            raise ValueError('not a packed Unidecode tables file')
+
+        self._buf = buf
+        self._bitmaps_offset = _header.size + self.n_sections * _section.size
+        self._entries_offset = self._bitmaps_offset + n_bitmaps * 2 * BITMAP_SIZE
+        self._blob_offset = self._entries_offset + n_entries * _entry.size
+        self._n_entries = n_entries
+
+        # Strings decoded from the blob, by their offset. Since equal strings
+        # share an offset, each distinct replacement exists only once in
+        # memory, regardless of how many sections or translation tables use
+        # it.
+        self._strings: Dict[int, str] = {}
+
+        # Shared memory block that buf belongs to, kept so that it stays
+        # mapped while the tables are used.
+        self._shm: Optional['SharedMemory'] = None
+
+    @classmethod
+    def open(cls, path: str) -> 'PackedTables':
+        with open(path, 'rb') as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buf)
+
+    @classmethod
+    def attach(cls, name: str) -> 'PackedTables':
+        """Use the tables in the shared memory block name without copying
+        them."""
+        from multiprocessing.shared_memory import SharedMemory
+
+        shm = SharedMemory(name)
+        # buf is only None once the block is closed.
+        assert shm.buf is not None
+        try:
+            tables = cls(shm.buf)
+        except (ValueError, struct.error):
+            shm.close()
+            raise
+
+        tables._shm = shm
+        return tables
+
+    def data(self) -> bytes:
+        """Return a copy of the packed data."""
+        return bytes(self._buf)
+
+    def section(self, section: int) -> Optional[PackedSection]:
+        """Return the table for section or None if there is no table."""
+        if section >= self.n_sections:
+            return None
+
+        first, length, bitmap = _section.unpack_from(self._buf, _header.size + section * _section.size)
+        if length == 0:
+            return None
+
+        offset = self._bitmaps_offset + bitmap * 2 * BITMAP_SIZE
+        present = int.from_bytes(self._buf[offset:offset+BITMAP_SIZE], 'little')
+        offset += BITMAP_SIZE
+        nonempty = int.from_bytes(self._buf[offset:offset+BITMAP_SIZE], 'little')
+
+        return PackedSection(self,
+                self._entries_offset + first * _entry.size, length,
+                present, nonempty)
+
+    def string(self, entry_offset: int) -> str:
+        """Return the string for the entry at entry_offset in the file."""
+        start, length = _entry.unpack_from(self._buf, entry_offset)
+
+        try:
+            return self._strings[start]
+        except KeyError:
+            pass
+
+        blob_start = self._blob_offset + start
+        s = str(self._buf[blob_start:blob_start+length], 'ascii')
+        return self._strings.setdefault(start, s)
+
+    def stats(self) -> Dict[str, int]:
+        """Return sizes of the packed data and of the decoded strings."""
+        offsets = set()
+        string_bytes = 0
+        for i in range(self._n_entries):
+            start, length = _entry.unpack_from(self._buf, self._entries_offset + i * _entry.size)
+            offsets.add(start)
+            string_bytes += length
+
+        return {
+            'file_bytes': len(self._buf),
+            'entries': self._n_entries,
+            'distinct_strings': len(offsets),
+            'string_bytes': string_bytes,
+            'blob_bytes': len(self._buf) - self._blob_offset,
+            'decoded_strings': len(self._strings),
+            'decoded_string_bytes': sum(sys.getsizeof(s) for s in self._strings.values()),
+        }
+
+def create_shared_block(data: bytes) -> 'SharedMemory':
+    """Copy packed tables data into a new shared memory block and return
+    it. The caller must close and unlink the block when it is no longer
+    needed."""
+    from multiprocessing.shared_memory import SharedMemory
+
+    shm = SharedMemory(create=True, size=len(data))
+    assert shm.buf is not None
+    shm.buf[:len(data)] = data
+    return shm
+
+def open_tables(path: Optional[str] = None) -> Optional[PackedTables]:
+    """Open the packed tables shipped with the package.
+
+    Returns None if the file is not available, for example when running from
+    a source checkout where it hasn't been built.
+    """
+    if path is None:
+        path = os.path.join(os.path.dirname(__file__), TABLES_FILE)
+
+    try:
+        return PackedTables.open(path)
+    except (OSError, ValueError, struct.error):
+        return None
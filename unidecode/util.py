@@ -1,16 +1,109 @@
 # vim:ts=4 sw=4 expandtab softtabstop=4
 import argparse
+import codecs
+import collections
+import concurrent.futures
 import io
 import locale
 import os
 import sys
+import time
 
-from unidecode import unidecode
+from unidecode import _decode_before_error, unidecode, unidecode_stream
+
+# Size in bytes of input blocks that are transliterated in parallel with
+# --jobs
+BLOCK_SIZE = 4 * 1024 * 1024
 
 def fatal(msg):
     sys.stderr.write(msg + "\n")
     sys.exit(1)
 
+class LineCounter:
+    """Wraps a binary stream and keeps track of line numbers of the data
+    that was read, for error messages."""
+
+    def __init__(self, stream):
+        self.stream = stream
+
+        # Number of complete lines and bytes in the last incomplete line
+        # before the most recently read chunk.
+        self.line_nr = 0
+        self.column = 0
+
+        self.chunk = b''
+        self.bytes_read = 0
+
+    def read(self, size):
+        newlines = self.chunk.count(b'\n')
+        if newlines:
+            self.line_nr += newlines
+            self.column = len(self.chunk) - self.chunk.rindex(b'\n') - 1
+        else:
+            self.column += len(self.chunk)
+
+        self.chunk = self.stream.read(size)
+        self.bytes_read += len(self.chunk)
+        return self.chunk
+
+    def decode_error_position(self, e):
+        """Return the line number and start, end offsets in that line of a
+        decode error in the most recently read chunk."""
+
+        # The decoder might have kept some bytes from the previous chunk
+        # that it couldn't decode yet.
+        pending = len(e.object) - len(self.chunk)
+
+        i = e.object.rfind(b'\n', pending, e.start)
+        if i == -1:
+            line_nr = self.line_nr
+            line_start = pending - self.column
+        else:
+            line_nr = self.line_nr + e.object.count(b'\n', pending, e.start)
+            line_start = i + 1
+
+        return line_nr, e.start - line_start, e.end - line_start
+
+def transliterate_parallel(reader, writer, encoding, jobs, block_size=BLOCK_SIZE):
+    """Transliterate text read from reader, a LineCounter, to writer using
+    jobs processes.
+
+    Input is decoded here with an incremental decoder, like in
+    unidecode_stream(), so blocks can be split anywhere, even in the middle
+    of a line or of a multibyte character, and any encoding can be used.
+    Only the decoded blocks are transliterated in parallel. Raises
+    UnicodeDecodeError if the input can't be decoded, after the text before
+    the error is written."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        # Results must be written in the original order. Keep a limited
+        # number of blocks in flight so that memory use stays bounded.
+        pending = collections.deque()
+
+        decode_error = None
+        while True:
+            data = reader.read(block_size)
+            try:
+                text = decoder.decode(data, final=not data)
+            except UnicodeDecodeError as e:
+                decode_error = e
+                text = _decode_before_error(decoder, data, e)
+
+            if text:
+                pending.append(executor.submit(unidecode, text))
+                if len(pending) >= 2 * jobs:
+                    writer.write(pending.popleft().result())
+
+            if not data or decode_error is not None:
+                break
+
+        while pending:
+            writer.write(pending.popleft().result())
+
+    if decode_error is not None:
+        raise decode_error
+
 def main():
     default_encoding = locale.getpreferredencoding()
 
@@ -21,12 +114,19 @@ def main():
             help='Specify an encoding (default is %s)' % (default_encoding,))
     parser.add_argument('-c', metavar='TEXT', dest='text',
             help='Transliterate TEXT instead of FILE')
+    parser.add_argument('-j', '--jobs', metavar='N', type=int, default=1,
+            help='Transliterate using N parallel processes (default is 1)')
+    parser.add_argument('--stats', action='store_true',
+            help='Print throughput to standard error when done')
     parser.add_argument('path', nargs='?', metavar='FILE')
 
     args = parser.parse_args()
 
     encoding = args.encoding
 
+    if args.jobs < 1:
+        fatal("Number of jobs must be at least 1")
+
     if args.path:
         if args.text:
             fatal("Can't use both FILE and -c option")
@@ -41,11 +141,25 @@ def main():
     else:
         stream = sys.stdin.buffer
 
-    for line_nr, line in enumerate(stream):
-        try:
-            line = line.decode(encoding)
-        except UnicodeDecodeError as e:
-            fatal('Unable to decode input line %s: %s, start: %d, end: %d' % (line_nr, e.reason, e.start, e.end))
+    start_time = time.perf_counter()
+
+    reader = LineCounter(stream)
+
+    try:
+        if args.jobs > 1:
+            transliterate_parallel(reader, sys.stdout, encoding, args.jobs)
+        else:
+            unidecode_stream(reader, sys.stdout, encoding)
+    except UnicodeDecodeError as e:
+        line_nr, start, end = reader.decode_error_position(e)
+        fatal('Unable to decode input line %s: %s, start: %d, end: %d' % (line_nr, e.reason, start, end))
+    finally:
+        stream.close()
+
+    bytes_read = reader.bytes_read
 
-        sys.stdout.write(unidecode(line))
-    stream.close()
+    if args.stats:
+        sys.stdout.flush()
+        elapsed = time.perf_counter() - start_time
+        sys.stderr.write('Transliterated %d bytes in %.2f s (%.1f MB/s)\n' % (
+                bytes_read, elapsed, bytes_read / elapsed / 1e6 if elapsed > 0 else 0.))